@@ -1,6 +1,5 @@
 import argparse
 import os
-import json
 from .filelib import FileLib
 
 
@@ -189,6 +188,19 @@ def make_parser():
                 )
             )
         ),
+        dict(
+            key="find_folder_by_uuid",
+            help="""
+            Print the path of the indexed folder with a particular UUID.
+            """,
+            kwargs=dict(
+                uuid=dict(
+                    type=str,
+                    default=None,
+                    help="UUID of the indexed folder to locate"
+                )
+            )
+        ),
         dict(
             key="change_name",
             help="""
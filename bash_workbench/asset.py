@@ -1,5 +1,15 @@
 from .folder_hierarchy import FolderHierarchyBase
 from .dataset import Dataset
+from .filelib import ensure
+
+# Each asset configuration must contain these keys,
+# with values of the paired types
+CONFIG_SCHEMA = (
+    ("key", str),
+    ("name", str),
+    ("description", str),
+    ("args", dict)
+)
 
 class Asset(FolderHierarchyBase):
     """
@@ -44,25 +54,22 @@ class Asset(FolderHierarchyBase):
             )
         )
 
-    def validate_config(self, disallowed_args=["base_folder", "profile", "filesystem", "print_format"]):
+    def validate_config(self, disallowed_args=frozenset(["base_folder", "profile", "filesystem", "print_format"])):
         """Validate that the tool or launcher is configured correctly"""
 
-        # The asset must contain a handful of elements
-        for key, value_type in [
-            ("key", str),
-            ("name", str),
-            ("description", str),
-            ("args", dict)
-        ]:
+        # The asset must contain the elements laid out in the
+        # module-level schema
+        for key, value_type in CONFIG_SCHEMA:
 
-            assert key in self.config, f"Asset configuration must contain key '{key}'"
-            assert isinstance(self.config[key], value_type), f"{key} must be of type {value_type}, not {type(self.config[key])}"
+            ensure(key in self.config, f"Asset configuration must contain key '{key}'")
+            ensure(isinstance(self.config[key], value_type), f"{key} must be of type {value_type}, not {type(self.config[key])}")
 
-            # There are a handful of argument keys which are not allowed, since they
-            # will conflict with flags used by the wb utility itself
-            for arg_key in self.config["args"]:
+        # There are a handful of argument keys which are not allowed, since they
+        # will conflict with flags used by the wb utility itself
+        # (checked in a single pass, rather than once per schema key)
+        for arg_key in self.config["args"]:
 
-                assert arg_key not in disallowed_args, f"Keyword argument cannot be used: {arg_key}"
+            ensure(arg_key not in disallowed_args, f"Keyword argument cannot be used: {arg_key}")
 
     def copy_to_dataset(self, dataset:Dataset, overwrite=False):
         """Copy the files from an asset to a Dataset."""
@@ -73,6 +80,14 @@ class Asset(FolderHierarchyBase):
         # Create the folder if it does not exist
         dataset.setup_asset_folder(self.asset_type)
 
+        # List the contents of the destination folder a single time, so that
+        # collisions can be checked without a filesystem call per file
+        existing_files = set(
+            self.filelib.listdir(
+                dataset.wb_path(self.asset_type)
+            )
+        )
+
         # For each of the files associated with this asset
         for fn in self.listdir():
 
@@ -80,7 +95,7 @@ class Asset(FolderHierarchyBase):
             dest_path = dataset.wb_path(self.asset_type, fn)
 
             # If a file already exists in the destination
-            if self.filelib.exists(dest_path):
+            if fn in existing_files:
 
                 # And the overwrite flag was not set, raise an error
                 assert overwrite, f"Cannot copy {fn} to {dest_path} - file exists"
@@ -97,3 +112,8 @@ class Asset(FolderHierarchyBase):
             f"{self.asset_type}_repo",
             self.repo_path
         )
+
+        # Re-read the asset configurations, so that a Dataset object
+        # which is reused across the session picks up the newly-copied
+        # configuration without being reconstructed
+        dataset.read_asset_configs()
@@ -1,6 +1,6 @@
 from typing import List
 from .folder_hierarchy import FolderHierarchyBase
-from .timestamp import Timestamp
+from .timestamp import TIMESTAMP
 from .filelib import FileWatcher
 import subprocess
 import uuid
@@ -24,8 +24,16 @@ class Dataset(FolderHierarchyBase):
         # The path must point to a directory
         assert self.filelib.isdir(self.base_path), f"Dataset must be a directory, not {self.base_path}"
 
-        # Make a timestamp object
-        self.timestamp = Timestamp()
+        # Attach the shared timestamp object
+        self.timestamp = TIMESTAMP
+
+        # Precompute the path of the ._wb/ folder, which prefixes every
+        # workbench file path constructed for this dataset
+        self.wb_folder = self.path("._wb")
+
+        # Precompute the path of the index file, which is by far the most
+        # frequently accessed file within ._wb/
+        self.index_fp = self.wb_path("index.json")
 
         # If there are files present in this folder which define the
         # properties of the dataset index, tool, or launcher,
@@ -74,13 +82,25 @@ class Dataset(FolderHierarchyBase):
             # so we should stop now
             return
 
-        # Read in the file (adding the prefix ._wb_), or assign
-        # a null value if the file does not exist
-        self.index = self.read_json("index.json")
+        # Read in the file from the precomputed path, or leave
+        # the null value if the file does not exist
+        try:
+            self.index = self.filelib.read_json(self.index_fp)
+        except (AssertionError, FileNotFoundError, NotADirectoryError):
+            pass
 
     def read_asset_configs(self):
         """Read in files describing the dataset's tool and launcher."""
 
+        # If the ._wb/ folder does not exist, there cannot be any
+        # configurations within it -- skipping the reads saves two
+        # failed opens for every unindexed folder touched during a walk
+        if not self.complete:
+
+            self.tool = None
+            self.launcher = None
+            return
+
         self.tool = self.read_json("tool/config.json")
         self.launcher = self.read_json("launcher/config.json")
 
@@ -93,16 +113,13 @@ class Dataset(FolderHierarchyBase):
         # Set up the path used for this asset
         fp = self.wb_path(fn)
 
-        # If the file exists
-        if self.filelib.exists(fp):
-
-            # Read it in and parse it as JSON
+        # Attempt to read the file directly, rather than first
+        # checking whether it exists
+        try:
             return self.filelib.read_json(fp)
 
-        # If the file does not exist
-        else:
-
-            # Return a null value
+        # If the file does not exist, return a null value
+        except (AssertionError, FileNotFoundError, NotADirectoryError):
             return
 
     def write_json(self, fn, dat, overwrite=False, **kwargs):
@@ -136,13 +153,18 @@ class Dataset(FolderHierarchyBase):
     def wb_path(self, *subfolder_list) -> str:
         """Return the path to a file in the ._wb/."""
 
-        return self.path("._wb", *subfolder_list)
+        # The ._wb/ prefix was precomputed when the dataset was created,
+        # so each call only joins the requested subfolder names
+        if len(subfolder_list) == 0:
+            return self.wb_folder
+
+        return self.wb_folder + "/" + "/".join(subfolder_list)
 
     def wb_path_exists(self, *subfolder_list) -> bool:
         """Boolean indicating whether a file in the ._wb/ folder eixsts."""
 
         return self.filelib.exists(
-            self.path("._wb", *subfolder_list)
+            self.wb_path(*subfolder_list)
         )
 
     def create_index(self):
@@ -161,7 +183,7 @@ class Dataset(FolderHierarchyBase):
         self.index = dict(
             uuid=str(uuid.uuid4()),
             indexed_at=self.timestamp.encode(),
-            name=self.base_path.rsplit("/", 1)[-1],
+            name=self.filelib.basename(self.base_path),
             description=""
         )
 
@@ -171,13 +193,18 @@ class Dataset(FolderHierarchyBase):
     def write_index(self, indent=4, sort_keys=True, overwrite=False):
         """Write the dataset index to the filesystem."""
 
-        # Write the index object to the index path
-        self.write_json(
-            "index.json",
+        # If the file exists
+        if self.filelib.exists(self.index_fp):
+
+            # Raise an error if overwrite is not True
+            assert overwrite, f"File exists but overwrite was not set ({self.index_fp})"
+
+        # Write the index object to the precomputed index path
+        self.filelib.write_json(
             self.index,
+            self.index_fp,
             indent=indent,
-            sort_keys=sort_keys,
-            overwrite=overwrite
+            sort_keys=sort_keys
         )
 
     def write_asset_params(self, asset_type, params, indent=4, sort_keys=True, overwrite=False):
@@ -186,9 +213,10 @@ class Dataset(FolderHierarchyBase):
         # Make sure that a folder exists for this asset type
         self.setup_asset_folder(asset_type)
 
-        # Write the params object to the appropriate path for the asset type
+        # Write the params object to the appropriate path for the asset
+        # type (write_json expands the path relative to ._wb/)
         self.write_json(
-            self.wb_path(asset_type, "params.json"),
+            f"{asset_type}/params.json",
             params,
             indent=indent,
             sort_keys=sort_keys,
@@ -198,9 +226,10 @@ class Dataset(FolderHierarchyBase):
     def read_asset_params(self, asset_type):
         """Read the parameters for an asset in JSON format."""
 
-        # Write the params object to the appropriate path for the asset type
+        # Read the params object from the appropriate path for the asset
+        # type (read_json expands the path relative to ._wb/)
         return self.read_json(
-            self.wb_path(asset_type, "params.json")
+            f"{asset_type}/params.json"
         )
 
     def write_asset_env(self, asset_type, env, overwrite=False):
@@ -215,9 +244,10 @@ class Dataset(FolderHierarchyBase):
             self.log(f"Environment: {env_name}='{env_val}'")
             env_script += "\n" + f"export {env_name}='{env_val}'"
 
-        # Write the params object to the appropriate path for the asset type
+        # Write the script to the appropriate path for the asset type
+        # (write_text expands the path relative to ._wb/)
         self.write_text(
-            self.wb_path(asset_type, "env"),
+            f"{asset_type}/env",
             env_script,
             overwrite=overwrite
         )
@@ -258,37 +288,72 @@ class Dataset(FolderHierarchyBase):
             # Write the index, if a modification was made
             self.write_index(overwrite=True)
 
-    def children(self):
-        """Return a list with the uuids of any indexed folders inside this one."""
+    def children(self, known_uuids:dict=None):
+        """
+        Return a list with the uuids of any indexed folders inside this one.
+        If a dict of known path -> uuid mappings is provided, those paths are
+        resolved from the dict instead of reading their index files again.
+        """
 
         children_uuids = list()
 
-        # Iterate over all of the paths inside this folder
-        for subfolder in self.listdir():
+        # Index files for the subfolders whose uuid is not already known,
+        # recorded as (position, path) so that the batch read below can
+        # fill in the results while preserving the directory order
+        to_read = list()
+
+        # Scan the contents of this folder, which provides cached file
+        # type information without a separate stat call per path
+        for entry in self.filelib.scandir(self.base_path):
 
             # Skip the ._wb/ folder
-            if subfolder == "._wb":
+            if entry.name == "._wb":
                 continue
 
-            # Construct the complete path to the subfolder
-            subfolder = self.path(subfolder)
+            # If it is a directory (not following symlinks, which avoids a
+            # stat per entry and keeps linked folders from being claimed
+            # as children of this one)
+            if entry.is_dir(follow_symlinks=False):
 
-            # If it is a directory
-            if self.filelib.isdir(subfolder):
+                # If the uuid of this subfolder is already known (e.g. from
+                # walking the home tree), there is no need to re-read its index
+                if known_uuids is not None:
 
-                # Get the index of the subfolder, if any exists
-                ds = Dataset(
-                    base_path=subfolder,
-                    filelib=self.filelib,
-                    verbose=self.verbose,
-                    logger=self.logger
+                    uuid = known_uuids.get(entry.path)
+
+                    if uuid is not None:
+                        children_uuids.append(uuid)
+                        continue
+
+                # Hold the position open, to be filled in from the
+                # index of the subfolder (if any exists)
+                children_uuids.append(None)
+                to_read.append(
+                    (len(children_uuids) - 1, f"{entry.path}/._wb/index.json")
                 )
 
-                # If the subfolder has an index
-                if ds.index is not None:
+        # Read any remaining index files in a single batch, which overlaps
+        # the I/O when there are many subfolders -- reading the index
+        # directly, rather than constructing an entire Dataset object,
+        # skips parsing the tool and launcher configurations
+        if to_read:
+
+            indexes = self.filelib.read_json_many([fp for _, fp in to_read])
+
+            for position, fp in to_read:
 
-                    # Add the 'uuid' to the list
-                    children_uuids.append(ds.index["uuid"])
+                index = indexes[fp]
+
+                # If the subfolder has an index, add the 'uuid' to the list
+                if index is not None:
+                    children_uuids[position] = index["uuid"]
+
+            # Drop the positions for subfolders which are not indexed
+            children_uuids = [
+                uuid
+                for uuid in children_uuids
+                if uuid is not None
+            ]
 
         return children_uuids
 
@@ -1,6 +1,22 @@
 from .dataset import Dataset
 
 
+# Numeric codes for the position of a dataset within its group of siblings
+POSITION_SINGLE, POSITION_FIRST, POSITION_LAST, POSITION_MIDDLE = range(4)
+
+# Prefix used for the name line of each dataset in the tree,
+# indexed by the position code -- tuple indexing avoids hashing
+# a key for every node rendered
+NAME_PREFIX = (" └─", " └┬", "  └", "  ├")
+
+# Prefix used for the additional lines of each dataset in the tree, indexed
+# by [the group continues after this dataset][the dataset has children]
+ADDL_PREFIX = (
+    ("     ", "    │"),
+    ("  │  ", "  │ │"),
+)
+
+
 class Datasets:
     """Collection of datasets with useful helper functions."""
 
@@ -15,8 +31,8 @@ class Datasets:
         # Keep track of the parent of each dataset
         self.parent_dict = dict()
 
-        # Keep track of the absolute path of each dataset
-        # abs_path -> uuid
+        # Keep track of the Dataset object for each absolute path
+        # abs_path -> Dataset
         self.path_dict = dict()
 
         # Keep track of whether each dataset passes the filter
@@ -25,6 +41,34 @@ class Datasets:
         # Keep a list of all filters which have been applied
         self.filters = list()
 
+        # Lazily-built index of (tag key, tag value) -> set of uuids,
+        # used to answer exact tag queries with a single lookup
+        self._tag_index = None
+
+        # Lazily-built index of each three-character window (lowercased)
+        # of a dataset's name or description -> set of uuids, used to
+        # narrow substring queries to a small candidate set
+        self._trigram_index = None
+
+        # Cached output of filtered_paths (keyed by the separator),
+        # cleared whenever the filters or the membership of the
+        # collection change
+        self._filtered_paths_cache = dict()
+
+        # Cached set of UUIDs which pass the current filters (keyed by
+        # whether ancestors are included), invalidated alongside the
+        # formatted paths above
+        self._filtered_uuids_cache = dict()
+
+        # Cached rendering of the dataset tree, invalidated in the same
+        # places -- redrawing the filter menu reuses the string instead
+        # of re-walking and re-formatting every dataset
+        self._tree_cache = None
+
+        # The filters grouped into a form which can be evaluated against
+        # a dataset in a single pass, rebuilt when the filters change
+        self._compiled_filters = None
+
         # When the object is instantiated, do not automatically walk the home tree
         self._populated = False
 
@@ -34,11 +78,21 @@ class Datasets:
         # If we haven't already populated the datasets
         if not self._populated:
 
-            # Iterate over all of the datasets and collections linked to the home folder
-            for ds in self.wb.walk_home_tree():
+            # Collect all of the datasets and collections linked to the home folder
+            all_datasets = list(self.wb.walk_home_tree())
 
-                # Add the dataset to the collection
-                self.add(ds)
+            # The walk already established the uuid of every linked folder --
+            # pass that map along so that collecting the children of each
+            # dataset does not re-read the index files of linked subfolders
+            known_uuids = {
+                ds.base_path: ds.index["uuid"]
+                for ds in all_datasets
+            }
+
+            # Add each dataset to the collection
+            for ds in all_datasets:
+
+                self.add(ds, known_uuids=known_uuids)
 
         self._populated = True
 
@@ -59,10 +113,11 @@ class Datasets:
         path = self.wb.filelib.abs_path(path)
 
         # If the path has already been parsed
-        if self.path_dict.get(path) is not None:
+        ds = self.path_dict.get(path)
+        if ds is not None:
 
             # Return that dataset
-            return self.path_dict.get(path)
+            return ds
 
         # If the path has not yet been parsed
         else:
@@ -84,7 +139,7 @@ class Datasets:
             # Return the dataset
             return ds
 
-    def add(self, ds:Dataset) -> None:
+    def add(self, ds:Dataset, known_uuids:dict=None) -> None:
         """Add a single dataset."""
 
         # If the dataset is not indexed
@@ -95,7 +150,7 @@ class Datasets:
 
         # Add the dataset attributes to the config object
         ds.index["path"] = ds.base_path
-        ds.index["children"] = ds.children()
+        ds.index["children"] = ds.children(known_uuids=known_uuids)
 
         # For each of the children of the dataset
         for child_uuid in ds.index["children"]:
@@ -113,16 +168,21 @@ class Datasets:
         # Add it to the dict, keyed by uuid
         self.datasets[ds.index["uuid"]] = ds.index
 
-        # Record the path -> uuid
-        self.path_dict[ds.index["uuid"]] = ds.base_path
+        # Record the path -> Dataset
+        self.path_dict[ds.base_path] = ds
 
-        # By default, all datasets initially pass the filter
-        self.passes_filter[ds.index["uuid"]] = True
+        # Any previously-built tag index, trigram index, formatted list
+        # of paths, set of passing UUIDs, or rendered tree no longer
+        # covers this dataset
+        self._tag_index = None
+        self._trigram_index = None
+        self._filtered_paths_cache.clear()
+        self._filtered_uuids_cache.clear()
+        self._tree_cache = None
 
-        # Apply any filters which have been set
-        for (field, value) in self.filters:
-
-            self._filter_one(ds.index["uuid"], field=field, value=value)
+        # Apply any filters which have been set, evaluating all of them
+        # against the new dataset in a single pass
+        self.passes_filter[ds.index["uuid"]] = self._passes_all_filters(ds.index["uuid"])
 
     def add_filter(self, field:str=None, value:str=None):
         """Add a filter to all datasets."""
@@ -130,6 +190,13 @@ class Datasets:
         # Add the field, value tuple to the list of filters
         self.filters.append((field, value))
 
+        # Any formatted list of paths, set of passing UUIDs, rendered
+        # tree, or grouped filters no longer reflects the filters
+        self._filtered_paths_cache.clear()
+        self._filtered_uuids_cache.clear()
+        self._tree_cache = None
+        self._compiled_filters = None
+
         # Apply the filter to all datasets
         self._filter_all(field=field, value=value)
 
@@ -143,79 +210,210 @@ class Datasets:
             if f != field or v != value
         ]
 
-        # Reset all filters for the datasets
-        self._reset_filter_all()
+        # Any formatted list of paths, set of passing UUIDs, rendered
+        # tree, or grouped filters no longer reflects the filters
+        self._filtered_paths_cache.clear()
+        self._filtered_uuids_cache.clear()
+        self._tree_cache = None
+        self._compiled_filters = None
 
         # Re-filter every dataset on the remaining filters
         self._apply_filters()
 
-    def _apply_filters(self):
-        """Apply all of the filters to all of the datasets."""
+    def _compile_filters(self) -> tuple:
+        """
+        Return the filters grouped into a form which can be evaluated
+        against a dataset in a single pass: a list of (key, value) exact
+        tag matches, and a list of (field, needle) lowercase substring
+        tests. Rebuilt whenever the filters change.
+        """
+
+        if self._compiled_filters is None:
+
+            tag_pairs = list()
+            substring_tests = list()
+
+            for field, value in self.filters:
 
-        for (field, value) in self.filters:
+                # For tags, the 'value' must be "{key}={value}"
+                if field == "tag":
 
-            self._filter_all(field=field, value=value)
+                    msg = "To filter by tag, provide query in the format 'key=value'"
+                    assert "=" in value, msg
+                    assert value.endswith("=") is False, msg
 
-    def _filter_one(self, ds_uuid, field:str=None, value:str=None):
-        """Apply a filter to a single dataset."""
+                    # Parse the tag key and value
+                    tag_pairs.append(tuple(value.split("=", 1)))
 
-        # The ds_uuid must identify an entry in self.datasets
-        assert ds_uuid in self.datasets, f"Dataset not found: {ds_uuid}"
+                # For all other query fields, lowercase the query a
+                # single time, not once per dataset
+                else:
 
-        # If the dataset has already been filtered out
-        if not self.passes_filter[ds_uuid]:
+                    substring_tests.append((field, value.lower()))
 
-            # There is no need to evaluate it again
-            return
+            self._compiled_filters = (tag_pairs, substring_tests)
+
+        return self._compiled_filters
+
+    def _passes_all_filters(self, ds_uuid:str) -> bool:
+        """Evaluate every filter against a single dataset in one pass."""
+
+        # Get the grouped form of the filters
+        tag_pairs, substring_tests = self._compile_filters()
 
         # Get the information for this dataset
         ds_info = self.datasets[ds_uuid]
 
-        # For tags, the 'value' must be "{key}={value}"
+        # Check if each tag has been set, and if the value matches
+        if tag_pairs:
+
+            tags = ds_info.get("tags", {})
+
+            for key, value in tag_pairs:
+
+                if tags.get(key) != value:
+                    return False
+
+        # Check if each query is in the indicated field (ignoring case)
+        for field, needle in substring_tests:
+
+            if needle not in ds_info[field].lower():
+                return False
+
+        return True
+
+    def _apply_filters(self):
+        """Apply all of the filters to all of the datasets."""
+
+        # Evaluate every filter against each dataset in a single pass,
+        # rather than sweeping the whole collection once per filter
+        for ds_uuid in self.datasets:
+
+            self.passes_filter[ds_uuid] = self._passes_all_filters(ds_uuid)
+
+    def _get_tag_index(self) -> dict:
+        """Return the map of (tag key, tag value) -> set of uuids, building it if needed."""
+
+        # Build the index a single time -- it is reset whenever a
+        # dataset is added to the collection
+        if self._tag_index is None:
+
+            self._tag_index = dict()
+
+            # Iterate over the tags which have been set on every dataset
+            for ds_uuid, ds_info in self.datasets.items():
+
+                for key, value in ds_info.get("tags", {}).items():
+
+                    self._tag_index.setdefault((key, value), set()).add(ds_uuid)
+
+        return self._tag_index
+
+    def _get_trigram_index(self) -> dict:
+        """Return the map of trigram -> set of uuids, building it if needed."""
+
+        # Build the index a single time -- it is reset whenever a
+        # dataset is added to the collection
+        if self._trigram_index is None:
+
+            self._trigram_index = dict()
+
+            # Index every three-character window of the name and the
+            # description of every dataset, ignoring case
+            for ds_uuid, ds_info in self.datasets.items():
+
+                for field in ("name", "description"):
+
+                    text = ds_info.get(field, "").lower()
+
+                    for i in range(len(text) - 2):
+
+                        self._trigram_index.setdefault(text[i:i + 3], set()).add(ds_uuid)
+
+        return self._trigram_index
+
+    def _trigram_candidates(self, needle:str) -> set:
+        """
+        Return the set of uuids whose name or description contains every
+        trigram of the (lowercased) query. Containing every trigram is
+        necessary but not sufficient for containing the query itself, so
+        the caller must still verify the actual substring.
+        """
+
+        trigram_index = self._get_trigram_index()
+
+        candidates = None
+
+        # A dataset can only contain the query if it contains every
+        # three-character window of the query, so the candidates are the
+        # intersection of the posting lists (a C-level set operation)
+        for i in range(len(needle) - 2):
+
+            posting = trigram_index.get(needle[i:i + 3], set())
+
+            candidates = posting if candidates is None else candidates & posting
+
+            # Stop as soon as the intersection is empty
+            if not candidates:
+                break
+
+        return candidates if candidates is not None else set()
+
+    def _filter_all(self, field:str=None, value:str=None):
+        """Apply a filter to all datasets."""
+
+        # Tag queries are exact matches on 'key=value', so the tag index
+        # answers them with a single lookup instead of testing each dataset
         if field == "tag":
 
             msg = "To filter by tag, provide query in the format 'key=value'"
             assert "=" in value, msg
             assert value.endswith("=") is False, msg
 
-            # parse the tag key and value
-            key, value = value.split("=", 1)
+            # Parse the tag key and value
+            key, tag_value = value.split("=", 1)
 
-            # Check if the tag has been set, and if the value matches
-            self.passes_filter[ds_uuid] = ds_info.get("tags", {}).get(key) == value
+            # The set of datasets which have this exact tag
+            matching = self._get_tag_index().get((key, tag_value), set())
 
-        # For all other query fields
-        else:
+            # Filter out any passing dataset which is not in the matching set
+            for ds_uuid in self.datasets:
 
-            # Check if the query is in the indicated field
-            self.passes_filter[ds_uuid] = value in ds_info[field]
+                if self.passes_filter[ds_uuid] and ds_uuid not in matching:
+                    self.passes_filter[ds_uuid] = False
 
-    def _reset_filter_one(self, ds_uuid:str):
-        """Reset the filter for a single dataset."""
+        # For all other query fields
+        else:
 
-        # The ds_uuid must identify an entry in self.datasets
-        assert ds_uuid in self.datasets, f"Dataset not found: {ds_uuid}"
+            # Lowercase the query a single time, not once per dataset
+            needle = value.lower()
 
-        # Set the entry in passes_filter to True
-        self.passes_filter[ds_uuid] = True
+            # Substring queries on the name or description are narrowed
+            # with the trigram index before the substring itself is
+            # checked. Queries shorter than three characters have no
+            # complete trigram, and fall back to testing every dataset
+            if field in ("name", "description") and len(needle) >= 3:
 
-    def _filter_all(self, field:str=None, value:str=None):
-        """Apply a filter to all datasets."""
+                # The set of datasets which contain every trigram of the query
+                candidates = self._trigram_candidates(needle)
 
-        # Iterate over every dataset
-        for ds_uuid in self.datasets:
+                # Verify the actual substring, but only on the datasets
+                # which still pass and survived the trigram intersection
+                for ds_uuid, ds_info in self.datasets.items():
 
-            # Check the query
-            self._filter_one(ds_uuid, field=field, value=value)
+                    if self.passes_filter[ds_uuid]:
+                        self.passes_filter[ds_uuid] = (
+                            ds_uuid in candidates
+                            and needle in ds_info[field].lower()
+                        )
 
-    def _reset_filter_all(self, field:str=None, value:str=None):
-        """Reset the filter for all datasets."""
+            else:
 
-        # Iterate over every dataset
-        for ds_uuid in self.datasets:
+                # Check the query against every dataset which still passes
+                for ds_uuid, ds_info in self.datasets.items():
 
-            # Reset the filter
-            self._reset_filter_one(ds_uuid)
+                    if self.passes_filter[ds_uuid]:
+                        self.passes_filter[ds_uuid] = needle in ds_info[field].lower()
 
     def _get_filtered_uuids(self, incl_anc:bool=True):
         """
@@ -224,6 +422,13 @@ class Datasets:
         be included. That behavior can be stopped by setting `incl_anc=False`
         """
 
+        # Serve repeated calls from the cache, which is cleared whenever
+        # the filters or the membership of the collection change --
+        # redisplaying a menu then skips re-walking every dataset
+        cached = self._filtered_uuids_cache.get(incl_anc)
+        if cached is not None:
+            return cached
+
         # Make a list of the datasets which pass the filter
         passing_uuids = [
             ds_uuid
@@ -240,8 +445,10 @@ class Datasets:
             # For each of the matching uuids
             for ds_uuid in passing_uuids:
 
-                # Iterate over the chain of parents back to the root
-                while ds_uuid is not None:
+                # Iterate over the chain of parents back to the root,
+                # stopping early if the chain was already traversed for
+                # a previously-encountered dataset
+                while ds_uuid is not None and ds_uuid not in to_keep:
 
                     # Add it to the set
                     to_keep.add(ds_uuid)
@@ -255,6 +462,9 @@ class Datasets:
             # Just keep the datasets which pass the filter
             to_keep = set(passing_uuids)
 
+        # Keep the set for any repeated calls
+        self._filtered_uuids_cache[incl_anc] = to_keep
+
         return to_keep
 
     def filtered(self, incl_anc:bool=True):
@@ -267,21 +477,31 @@ class Datasets:
         # Get the set of UUIDs to keep
         self.filtered_uuids = self._get_filtered_uuids(incl_anc=incl_anc)
 
-        # Keep the datasets which are in this set
-        datasets = {
-            ds_uuid: dataset
-            for ds_uuid, dataset in self.datasets.items()
-            if ds_uuid in self.filtered_uuids
-        }
+        # Build the output in a single pass, rather than materializing the
+        # dict and then re-iterating it to update the 'children' fields
+        datasets = dict()
+
+        # Iterate over every dataset
+        for ds_uuid, dataset in self.datasets.items():
 
-        # Update the 'children' field of each to only contain datasets in the set
-        for ds_uuid in datasets:
+            # Skip the datasets which are not in the set
+            if ds_uuid not in self.filtered_uuids:
+                continue
 
             # If there are any children
-            if len(datasets[ds_uuid].get("children", [])) > 0:
+            if dataset.get("children"):
 
                 # Subset the list to only overlap with `self.filtered_uuids`
-                datasets[ds_uuid]["children"] = list(set(datasets[ds_uuid]["children"]) & self.filtered_uuids)
+                # A single linear scan with hash lookups into the pre-built
+                # set, instead of allocating a temporary set per dataset
+                dataset["children"] = [
+                    child
+                    for child in dataset["children"]
+                    if child in self.filtered_uuids
+                ]
+
+            # Keep the dataset
+            datasets[ds_uuid] = dataset
 
         return datasets
 
@@ -302,37 +522,61 @@ class Datasets:
         where PATH_HIERARCHY is the <PATH>/<PATH>/etc. from root to the dataset.
         """
 
+        # Serve repeated calls from the cache, which is cleared whenever
+        # the filters or the membership of the collection change --
+        # re-entering a menu then skips re-formatting every dataset
+        cached = self._filtered_paths_cache.get(sep)
+        if cached is not None:
+            return list(cached)
+
         # Get the dict of all filtered datasets
         ds_dict = self.filtered()
 
-        # Make a dict of the name hierarchy for each dataset
-        names = {
-            k: "/".join([
+        # Build the combined strings in a single pass, rather than
+        # materializing intermediate dicts of names and paths
+        name_path_list = list()
+
+        # Iterate over each dataset
+        for k, ds_info in ds_dict.items():
+
+            # Make the name hierarchy from the root down to the dataset
+            name = "/".join([
                 ds_dict[i]["name"]
                 for i in self.path_to_root(ds_dict, k)
             ])
-            for k in ds_dict
-        }
-
-        # Make a dict of the absolute paths to each dataset
-        paths = {
-            k: ds_dict[k]["path"]
-            for k in ds_dict
-        }
-
-        # Make a list of the <NAME> : <PATH> combined strings if <NAME> != <PATH>
-        # Otherwise just return the <PATH>
-        name_path_list = [
-            sep.join([names[k], paths[k]]) if names[k] != paths[k] else names[k]
-            for k in ds_dict
-        ]
+
+            # Get the absolute path to the dataset
+            path = ds_info["path"]
+
+            # Combine the <NAME> : <PATH> strings if <NAME> != <PATH>
+            # Otherwise just use the <PATH>
+            name_path_list.append(
+                sep.join([name, path]) if name != path else name
+            )
 
         # Sort it
         name_path_list.sort()
 
+        # Keep a copy for any repeated calls
+        self._filtered_paths_cache[sep] = list(name_path_list)
+
         # Return the sorted list
         return name_path_list
 
+    def clear_filtered_paths_cache(self) -> None:
+        """
+        Clear every cache which depends on the contents of the dataset
+        indexes: the formatted paths, the rendered tree, and the tag and
+        trigram lookup indexes. Used when a dataset is modified in place
+        (e.g. renaming, or changing a tag), which the collection cannot
+        observe directly.
+        """
+
+        self._filtered_paths_cache.clear()
+        self._tree_cache = None
+        self._tag_index = None
+        self._trigram_index = None
+
     def path_to_root(self, d, k, reverse:bool=True):
         """
         For any dict, return the list of keys from the dict d
@@ -343,7 +587,12 @@ class Datasets:
         """
 
         l = list()
-        while k is not None and k in d:
+        seen = set()
+
+        # Stop at the root, or if a corrupted parent
+        # cycle returns to a key which was already visited
+        while k is not None and k in d and k not in seen:
+            seen.add(k)
             l.append(k)
             k = d[k].get('parent')
 
@@ -355,6 +604,12 @@ class Datasets:
     def format_dataset_tree(self):
         """Format a list of datasets as a tree."""
 
+        # Serve repeated calls from the cache, which is cleared whenever
+        # the filters, the membership of the collection, or the
+        # formatted names change
+        if self._tree_cache is not None:
+            return self._tree_cache
+
         # Get the set of UUIDs to keep
         self.filtered_uuids = self._get_filtered_uuids(incl_anc=True)
 
@@ -365,40 +620,39 @@ class Datasets:
             if ds_info.get("parent") is None and ds_uuid in self.filtered_uuids
         ]
 
-        # Recursively format each line of the tree
-        return "\n".join([
+        # Format each line of the tree, keeping the rendered string for
+        # any repeated calls
+        self._tree_cache = "\n".join([
             line
-            for line in self.yield_dataset_tree_recursive(root_datasets)
+            for line in self.yield_dataset_tree(root_datasets)
         ])
 
+        return self._tree_cache
 
-    def yield_dataset_tree_recursive(self, ds_uuids, indentation=""):
-        """Function to recursively print the directory structure."""
-
-        # Get the number of datasets in the list
-        dataset_n = len(ds_uuids)
-
-        # For each dataset, set the `list_position` as 'single', 'first', 'middle', or 'last'
-        # Also set the flag `has_children` as True/False
+    def yield_dataset_tree(self, ds_uuids, indentation=""):
+        """Function to print the directory structure, using an explicit stack rather than recursion."""
 
-        # Iterate over each dataset
-        for dataset_i, ds_uuid in enumerate(ds_uuids):
+        # Each entry on the stack is a (ds_uuid, indentation, list_position,
+        # continues) tuple
+        # The entries of each group are pushed in reverse order, so that
+        # .pop() yields the members of the group from first to last
+        stack = self.position_dataset_group(ds_uuids, indentation)
+        stack.reverse()
 
-            # If this dataset is a singlet
-            if dataset_n == 1:
-                list_position = "single"
+        # Keep track of the datasets which have been formatted, so that a
+        # corrupted parent/child cycle cannot cause an endless loop
+        seen = set()
 
-            # If there are multiple datasets, and this is the first one
-            elif dataset_i == 0:
-                list_position = "first"
+        # While there are any datasets left to format
+        while len(stack) > 0:
 
-            # If this is the last one in the list
-            elif dataset_i == dataset_n - 1:
-                list_position = "last"
+            # Get the next dataset to format
+            ds_uuid, indentation, list_position, continues = stack.pop()
 
-            # Otherwise, we are in the middle of a list
-            else:
-                list_position = "middle"
+            # Skip any dataset which has already been formatted
+            if ds_uuid in seen:
+                continue
+            seen.add(ds_uuid)
 
             # Get the list of children which also pass the filter
             ds_children = [
@@ -415,32 +669,71 @@ class Datasets:
                 ds_uuid,
                 indentation=indentation,
                 list_position=list_position,
-                has_children=has_children
+                has_children=has_children,
+                continues=continues
             )
 
-            # Recursively repeat the process for any children of this dataset
-            yield from self.yield_dataset_tree_recursive(
+            # Push any children of this dataset onto the stack
+            child_group = self.position_dataset_group(
                 ds_children,
                 # If this dataset is followed by others in this group
                 # Add a continuation character to the indentation
                 # Otherwise, there are no more in this group, and so the indentation is blank
-                indentation=indentation + "  │" if list_position in ["first", "middle"] else "   "
+                indentation + "  │" if continues else "   "
             )
+            child_group.reverse()
+            stack.extend(child_group)
+
+    def position_dataset_group(self, ds_uuids, indentation):
+        """Mark the position of each dataset within a group of siblings."""
+
+        # Get the number of datasets in the list
+        dataset_n = len(ds_uuids)
+
+        # For each dataset, set the `list_position` code as single, first,
+        # last, or middle
+        positioned = list()
+
+        # Iterate over each dataset
+        for dataset_i, ds_uuid in enumerate(ds_uuids):
+
+            # If this dataset is a singlet
+            if dataset_n == 1:
+                list_position = POSITION_SINGLE
+
+            # If there are multiple datasets, and this is the first one
+            elif dataset_i == 0:
+                list_position = POSITION_FIRST
+
+            # If this is the last one in the list
+            elif dataset_i == dataset_n - 1:
+                list_position = POSITION_LAST
+
+            # Otherwise, we are in the middle of a list
+            else:
+                list_position = POSITION_MIDDLE
+
+            positioned.append((
+                ds_uuid,
+                indentation,
+                list_position,
+                # Whether the group continues after this dataset
+                list_position in (POSITION_FIRST, POSITION_MIDDLE)
+            ))
+
+        return positioned
 
     def yield_dataset_tree_single(
         self,
         ds_uuid:str,
         indentation:str="",
         list_position=None,
-        has_children=None
+        has_children=None,
+        continues=None
     ):
 
-        name_prefix = dict(
-            single=" └─",
-            first=" └┬",
-            last="  └",
-            middle="  ├"
-        )[list_position]
+        # Look up the prefix from the precomputed module-level table
+        name_prefix = NAME_PREFIX[list_position]
 
         # Get the information for this dataset
         ds_info = self.datasets[ds_uuid]
@@ -450,10 +743,8 @@ class Datasets:
 
         # Make a separate prefix for any additional lines
         # If there are more items in the list, add a continuation
-        addl_prefix = "  │" if list_position in ["first", "middle"] else "   "
-
         # Add another continuation if there are children below this dataset
-        addl_prefix = f'{addl_prefix}{" │" if has_children else "  "}'
+        addl_prefix = ADDL_PREFIX[continues][has_children]
 
         # Print the uuid and any additional fields
         fields = [
@@ -1,8 +1,85 @@
 import gzip
 import json
+import mmap
 import os
 import shutil
+import stat as stat_module
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+
+def ensure(cond, msg, exc=AssertionError):
+    """
+    Raise an exception with the provided message if the condition is not met.
+    Unlike a bare assert, these checks are not stripped under python -O.
+
+    The convention throughout the package is two-tiered: user-facing
+    checks (missing files, malformed input) go through ensure() or raise
+    directly, so that the error message survives an optimized build,
+    while internal invariants in hot loops stay as bare asserts, which
+    -O strips along with their cost.
+    """
+    if not cond:
+        raise exc(msg)
+
+
+# Read and write JSON with orjson if it is available, which is considerably
+# faster than the stdlib module -- the dependency is optional, and the
+# stdlib json module is used as a fallback
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+def json_parse_count():
+    """
+    Number of JSON files actually parsed from disk (cache misses).
+    Useful for verifying that in-memory operations, such as dataset
+    filtering, do not trigger any reads.
+    """
+    return _parse_json_cached.cache_info().misses
+
+
+@lru_cache(maxsize=4096)
+def _parse_json_cached(path:str, mtime_ns:int, size:int):
+    """
+    Parse a JSON file, caching the result.
+    The mtime and size arguments are only used as part of the cache key,
+    so that any modification to the file invalidates the cached parse.
+    """
+
+    with open(path, 'rb') as handle:
+
+        # Documents of 1 MiB or more are memory-mapped, so that the parser
+        # consumes the page cache directly instead of copying the file
+        # into an intermediate bytes object first
+        # (only with orjson, which accepts a memoryview -- the stdlib
+        # parser would need a bytes copy anyway)
+        if orjson is not None and size >= (1 << 20):
+
+            try:
+                mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+            # Fall through to a plain read if the file cannot be mapped
+            except (ValueError, OSError):
+                pass
+
+            else:
+
+                view = memoryview(mm)
+
+                try:
+                    return _json_loads(view)
+
+                finally:
+                    view.release()
+                    mm.close()
+
+        return _json_loads(handle.read())
 
 
 class FileWatcher:
@@ -77,7 +154,16 @@ class FileLib:
         # Attach the type of filesystem being used
         self.filesystem = filesystem
 
-        assert filesystem == "local", "The only filesystem currently supported is 'local'"
+        ensure(filesystem == "local", "The only filesystem currently supported is 'local'")
+
+        # Cache of sanitized paths (see abs_path), which is cleared
+        # whenever a link is added or a path is removed
+        self._abs_path_cache = dict()
+
+        # Known JSON file contents provided up front (e.g. from a
+        # consolidated cache file), keyed by path with the stat signature
+        # used to verify freshness before each use
+        self._preloaded_json = dict()
 
     def home(self) -> str:
         """Return the home directory for the user."""
@@ -91,9 +177,16 @@ class FileLib:
         """Size of file object."""
         return os.path.getsize(path)
 
+    def isfile(self, path) -> bool:
+        """The path is a file."""
+        return os.path.isfile(path)
+
     def isdir(self, path) -> bool:
         """The path is a directory."""
-        return os.path.exists(path) and os.path.isdir(path)
+
+        # isdir already returns False for a missing path, so no
+        # separate exists check is needed
+        return os.path.isdir(path)
 
     def islink(self, path) -> bool:
         """The path is a link."""
@@ -106,35 +199,133 @@ class FileLib:
     def mkdir_p(self, path) -> None:
         """Make a folder if it does not already exist, assert that it is a directory."""
 
-        if not os.path.exists(path):
-            os.makedirs(path)
-        assert os.path.isdir(path), f"Must be a folder, not a file: {path}"
+        # Using exist_ok avoids a separate existence check, which both saves
+        # a filesystem call and closes the check-then-create race
+        try:
+            os.makedirs(path, exist_ok=True)
+        except FileExistsError:
+            raise AssertionError(f"Must be a folder, not a file: {path}")
 
     def rmdir(self, path) -> None:
         """Delete a path (file or folder) and its contents, if any exist."""
-        if os.path.exists(path):
+
+        # A single lstat both checks that the path exists and classifies
+        # it, instead of an exists probe followed by rmtree
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return
+
+        # Folders are removed recursively -- symlinks and files are
+        # removed directly, without walking through the link target
+        if stat_module.S_ISDIR(st.st_mode):
             shutil.rmtree(path)
+        else:
+            os.unlink(path)
+
+        self._abs_path_cache.clear()
 
     def rm(self, path) -> None:
         """Delete a path, if it exists."""
-        if os.path.exists(path):
+
+        # Remove the file directly, rather than checking for it first
+        try:
             os.remove(path)
+        except FileNotFoundError:
+            return
+
+        self._abs_path_cache.clear()
 
     def listdir(self, path) -> list:
         """List the contents of a directory."""
         return os.listdir(path)
 
+    def scandir(self, path) -> list:
+        """
+        List the contents of a directory as os.DirEntry objects,
+        which carry cached file type information from the directory scan.
+        """
+        with os.scandir(path) as entries:
+            return list(entries)
+
+    def count_entries(self, path) -> int:
+        """
+        Number of entries in a directory.
+        os.listdir returns bare names (no DirEntry objects), which makes
+        it the cheapest way to count when the entries themselves are
+        not needed.
+        """
+        return len(os.listdir(path))
+
     def path_join(self, *args) -> None:
         """Combine paths on the local filesystem."""
         return os.path.join(*args)
 
     def copyfile(self, source_path, dest_path, **kwargs) -> None:
         """Copy a file on the local filesystem."""
-        shutil.copyfile(source_path, dest_path, **kwargs)
+
+        # Any non-default options are handled by shutil directly
+        if kwargs:
+            shutil.copyfile(source_path, dest_path, **kwargs)
+            return
+
+        # When the platform provides copy_file_range, move the data
+        # entirely in kernel space -- no userspace buffer is involved,
+        # and filesystems which support reflinks can share extents
+        # instead of copying at all
+        if hasattr(os, "copy_file_range"):
+
+            try:
+                self._copy_file_range(source_path, dest_path)
+                return
+
+            # Fall through for filesystems which do not support it
+            except OSError:
+                pass
+
+        # Otherwise use shutil, which applies its own platform-specific
+        # fast paths (e.g. sendfile) where available
+        shutil.copyfile(source_path, dest_path)
+
+    def _copy_file_range(self, source_path, dest_path) -> None:
+        """Copy a file using in-kernel data transfer."""
+
+        src = os.open(source_path, os.O_RDONLY)
+
+        try:
+
+            # The source size bounds the amount of data to request
+            remaining = os.fstat(src).st_size
+
+            dst = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+            try:
+
+                # Transfer until the full length has been moved
+                while remaining > 0:
+
+                    sent = os.copy_file_range(src, dst, remaining)
+
+                    # Guard against an unexpected zero-byte transfer
+                    if sent == 0:
+                        break
+
+                    remaining -= sent
+
+            finally:
+                os.close(dst)
+
+        finally:
+            os.close(src)
+
+    def readlink(self, path) -> str:
+        """Return the target of a symlink."""
+        return os.readlink(path)
 
     def symlink(self, source, target) -> None:
         """Create a symlink."""
         os.symlink(source, target)
+        self._abs_path_cache.clear()
 
     def getcwd(self) -> str:
         """Return the current working directory."""
@@ -144,89 +335,249 @@ class FileLib:
         """Change working directories."""
         os.chdir(path)
 
+        # Relative paths resolve against the working directory, so any
+        # cached resolutions are no longer trustworthy
+        self._abs_path_cache.clear()
+
     def read_json(self, path:str) -> dict:
         """Read a file in JSON format."""
 
-        assert os.path.exists(path), f"Cannot read JSON, file does not exist {path}"
-
+        # Open (or stat) the file directly and translate a missing file into
+        # the same error as before -- this avoids a separate exists check
+        # ahead of every read, and closes the gap where the file could be
+        # removed between the check and the open
         if path.endswith(".gz"):
 
-            with gzip.open(path, 'rt') as handle:
-                return json.load(handle)
+            try:
+                # Decompress to bytes and hand them straight to the parser
+                # (both orjson and the stdlib accept bytes input), skipping
+                # the text-mode decode of the whole document
+                with gzip.open(path, 'rb') as handle:
+                    return _json_loads(handle.read())
+
+            except (FileNotFoundError, NotADirectoryError):
+                raise AssertionError(f"Cannot read JSON, file does not exist {path}")
 
         else:
 
-            with open(path, 'r') as handle:
-                return json.load(handle)
+            # Stat the file once, which both confirms that it exists and
+            # keys the cache, so that the same index or config file is
+            # only parsed once per invocation
+            try:
+                st = os.stat(path)
+
+            except (FileNotFoundError, NotADirectoryError):
+                raise AssertionError(f"Cannot read JSON, file does not exist {path}")
+
+            # If the contents of this file were provided up front, use them
+            # as long as the stat signature still matches -- any edit to the
+            # file since the preload changes the signature and falls through
+            pre = self._preloaded_json.get(path)
+            if (
+                pre is not None
+                and pre[0] == st.st_mtime_ns
+                and pre[1] == st.st_size
+            ):
+                return deepcopy(pre[2])
+
+            # Return a copy, so that the caller is free to modify the
+            # result without corrupting the cached object
+            return deepcopy(_parse_json_cached(path, st.st_mtime_ns, st.st_size))
 
     def read_json_in_folder(self, folder:str, file:str):
         """Return the contents of a JSON file in a folder, if both exist."""
 
-        # If the folder exists
-        if self.isdir(folder):
+        # Attempt to read the file directly, which costs a single failed
+        # filesystem call when it is missing, rather than separate checks
+        # for the folder and then the file
+        try:
+            return self.read_json(f"{folder}/{file}")
 
-            # Make the full path
-            fp = self.path_join(folder, file)
+        # If the folder or the file does not exist, return None
+        except (AssertionError, FileNotFoundError, NotADirectoryError):
+            return None
 
-            # If the file exists
-            if self.exists(fp):
 
-                # Return the contents of the JSON
-                return self.read_json(fp)
+    def preload_json(self, path:str, mtime_ns:int, size:int, dat) -> None:
+        """
+        Provide the known contents of a JSON file (e.g. from a consolidated
+        cache), keyed by its stat signature. read_json will only use the
+        preloaded value while the file's mtime and size still match.
+        """
+        self._preloaded_json[path] = (mtime_ns, size, dat)
 
-        # If neither exists, return None    
-        return None
-        
+    def read_json_many(self, paths:list) -> dict:
+        """
+        Read multiple JSON files, returning a dict keyed by path.
+        Paths which cannot be read are mapped to None.
+        """
+
+        # Tolerate missing files, so that a batch can be issued without
+        # checking for each file first
+        def read_one(path):
+            try:
+                return self.read_json(path)
+            except (AssertionError, FileNotFoundError, NotADirectoryError):
+                return None
+
+        # Small batches are read serially -- the pool only pays off when
+        # there are enough independent reads to overlap
+        if len(paths) < 8:
+            return {path: read_one(path) for path in paths}
+
+        # The GIL is released inside open and read, so dispatching the
+        # reads through a thread pool overlaps the I/O latency
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as pool:
+            return dict(zip(paths, pool.map(read_one, paths)))
 
     def write_json(self, dat, path, **kwargs) -> None:
         """Write a file in JSON format."""
 
-        with open(path, mode='w') as handle:
-            json.dump(dat, handle, **kwargs)
+        # Write to a temporary file in the same folder and then move it into
+        # place atomically, so that a reader can never observe a partially
+        # written file and a crash cannot truncate the existing one
+        tmp_path = f"{path}.tmp"
 
-    def read_text(self, path:str) -> str:
-        """Read a text file."""
+        # If orjson is available, encode with it directly to bytes
+        # The indent kwarg is honored only as indent-or-not (orjson
+        # supports two-space indenting), which keeps the files readable
+        if orjson is not None:
 
-        assert os.path.exists(path), f"Cannot read text, file does not exist {path}"
+            option = orjson.OPT_INDENT_2 if kwargs.get("indent") else 0
+            if kwargs.get("sort_keys"):
+                option |= orjson.OPT_SORT_KEYS
 
-        if path.endswith(".gz"):
+            serialized = orjson.dumps(dat, option=option)
 
-            with gzip.open(path, mode='rt') as handle:
-                return handle.read()
+            # Large documents are written through a raw descriptor:
+            # preallocate the full extent up front (avoiding incremental
+            # extent growth) and issue a single write, skipping the
+            # buffered file object entirely
+            if len(serialized) > 65536:
 
+                fd = os.open(
+                    tmp_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    0o666
+                )
+
+                try:
+                    if hasattr(os, "posix_fallocate"):
+                        os.posix_fallocate(fd, 0, len(serialized))
+
+                    os.write(fd, serialized)
+
+                finally:
+                    os.close(fd)
+
+            else:
+
+                with open(tmp_path, mode='wb') as handle:
+                    handle.write(serialized)
+
+        # Fall back to the stdlib encoder
         else:
-            with open(path, mode='r') as handle:
-                return handle.read()
 
-    def write_text(self, dat, path) -> None:
-        """Write a text file."""
+            with open(tmp_path, mode='w') as handle:
+                json.dump(dat, handle, **kwargs)
 
-        with open(path, 'w') as handle:
-            handle.write(dat)
+        os.replace(tmp_path, path)
 
-    def abs_path(self, path) -> str:
-        """Return a path to a location which exists, is not a symlink, and has no terminal slash."""
-        
-        assert os.path.exists(path), f"Location does not exist: {path}"
+    def read_text(self, path:str) -> str:
+        """Read a text file."""
+
+        # As with read_json, open the file directly rather than checking
+        # for it first, translating a missing file into the same error
+        try:
+
+            if path.endswith(".gz"):
+
+                with gzip.open(path, mode='rt') as handle:
+                    return handle.read()
+
+            else:
+                with open(path, mode='r') as handle:
+                    return handle.read()
 
-        # If the path points to a link
-        if os.path.islink(path):
+        except (FileNotFoundError, NotADirectoryError):
+            raise AssertionError(f"Cannot read text, file does not exist {path}")
 
-            # Resolve the link
-            path = os.readlink(path)
+    def write_text(self, dat, path) -> None:
+        """Write a text file."""
 
-        assert not os.path.islink(path), "Cannot follow nested symlinks"
+        # Use the same atomic write-then-rename approach as write_json
+        tmp_path = f"{path}.tmp"
 
-        # If there is a terminal slash in the pathname
-        if path.endswith("/"):
+        with open(tmp_path, 'w') as handle:
+            handle.write(dat)
 
-            # Remove it
-            path = path[:-1]
+        os.replace(tmp_path, path)
 
-        # Resolve the absolute path
-        path = os.path.abspath(path)
+    def abs_path(self, path, fresh:bool=False) -> str:
+        """
+        Return a path to a location which exists, is not a symlink, and has no terminal slash.
+        Set `fresh=True` to bypass the cache when the caller has just mutated the tree.
+        """
 
-        return path
+        # The same path is often sanitized several times within a single
+        # operation -- return the cached result when one is available
+        if not fresh:
+            cached = self._abs_path_cache.get(path)
+            if cached is not None:
+                return cached
+
+        # Fast path: an already-normalized absolute path whose final
+        # component is not a symlink can be returned as-is -- a single
+        # lstat answers both the existence check and the symlink check,
+        # skipping the component-by-component walk inside realpath
+        if (
+            path.startswith("/")
+            and not path.endswith("/")
+            and "/." not in path
+            and "//" not in path
+        ):
+
+            try:
+                st = os.lstat(path)
+            except OSError:
+                raise AssertionError(f"Location does not exist: {path}")
+
+            if not stat_module.S_ISLNK(st.st_mode):
+                self._abs_path_cache[path] = path
+                return path
+
+        # Resolve any symlinks (including chained links) and make the path
+        # absolute in a single C-level pass -- strict mode verifies that the
+        # location exists during the same traversal, so no separate stat of
+        # the result is needed
+        try:
+            resolved = os.path.realpath(path, strict=True)
+        except OSError:
+            raise AssertionError(f"Location does not exist: {path}")
+
+        # Remove any terminal slashes from the pathname
+        # (rstrip short-circuits when there is nothing to strip)
+        resolved = resolved.rstrip("/")
+
+        # Save the result for any repeated calls on the same path
+        # The resolved form maps to itself, so that re-sanitizing an
+        # already-resolved path short-circuits without another realpath
+        self._abs_path_cache[path] = resolved
+        self._abs_path_cache[resolved] = resolved
+
+        return resolved
+
+    def abs_path_cache_clear(self) -> None:
+        """Drop any cached path resolutions."""
+        self._abs_path_cache.clear()
+
+    def basename(self, path) -> str:
+        """Return the final component of a path."""
+
+        # A single slice avoids the intermediate list allocated by rsplit
+        return path[path.rfind("/") + 1:]
 
     def dirname(self, path) -> str:
         """Return the directory above a path."""
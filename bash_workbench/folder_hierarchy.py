@@ -1,3 +1,4 @@
+from collections import deque
 from .filelib import FileLib
 
 class FolderHierarchyBase:
@@ -69,13 +70,55 @@ class FolderHierarchyBase:
         # contain another list of dicts
         assert isinstance(self.structure, list), "structure must be a list"
 
-        # Recursively check each subfolder, starting with the top-level
-        for folder in self.structure:
-            self.check_folders_recursive(
-                base_path=self.base_path,
-                folder=folder
+        # Check each subfolder in breadth-first order, so that every parent
+        # is visited before any of its children
+        # A deque provides amortized O(1) appends and popleft, avoiding both
+        # recursion and list reallocation as the queue grows
+        folders_to_check = deque(
+            (self.base_path, folder)
+            for folder in self.structure
+        )
+
+        # Names of the folders present in each parent, scanned a single
+        # time per parent -- sibling folders then check membership in
+        # memory instead of issuing one filesystem call each
+        scanned = dict()
+
+        # While there are any folders left in the queue
+        while folders_to_check:
+
+            # Take the next folder from the front of the queue
+            base_path, folder = folders_to_check.popleft()
+
+            # Scan the parent folder the first time any of its
+            # children are checked
+            existing = scanned.get(base_path)
+            if existing is None:
+                existing = self._scan_folder_names(base_path)
+                scanned[base_path] = existing
+
+            # Check that folder, adding any children to the queue
+            self.check_folder(
+                base_path=base_path,
+                folder=folder,
+                folders_to_check=folders_to_check,
+                existing=existing
             )
 
+    def _scan_folder_names(self, base_path:str) -> set:
+        """Return the set of folder names within a path (empty if the path is missing)."""
+
+        try:
+            return {
+                entry.name
+                for entry in self.filelib.scandir(base_path)
+                if entry.is_dir(follow_symlinks=False)
+            }
+
+        # If the parent folder does not exist, then none of its children do
+        except FileNotFoundError:
+            return set()
+
     def populate_folders(self) -> None:
         """Add all of the folders expected within a structure, if they do not exist."""
         
@@ -85,12 +128,14 @@ class FolderHierarchyBase:
         # Create any subfolders which do not exist
         self.check_folders()
 
-    def check_folders_recursive(
+    def check_folder(
         self,
         base_path:str=None,
-        folder:dict=None
+        folder:dict=None,
+        folders_to_check:deque=None,
+        existing:set=None
     ) -> None:
-        """Check to see if a subfolder exists."""
+        """Check to see if a subfolder exists, queueing up any children."""
 
         # Each folder is a dict
         assert isinstance(folder, dict), f"Each folder must be a dict ({folder})"
@@ -101,54 +146,82 @@ class FolderHierarchyBase:
         # The name must be a string
         assert isinstance(folder["name"], str), f"Each folder's name must be a string ({folder['name']})"
 
-        # Construct the path to this folder
-        folder_path = self.filelib.path_join(base_path, folder["name"])
+        # Construct the path to this folder -- the name is a fixed, relative
+        # component of the layout, so a plain string join skips the
+        # per-argument handling inside os.path.join
+        folder_path = f"{base_path}/{folder['name']}"
 
-        # If the folder does not exist
-        if not self.filelib.exists(folder_path):
+        # If missing folders should be created
+        if self.create_subfolders:
 
-            # If it can be created
-            if self.create_subfolders:
+            # If the scan of the parent already showed this folder, there
+            # is no filesystem call to make at all
+            if existing is not None and folder["name"] in existing:
 
-                # Create it
-                self.log(f"Creating {folder_path}")
+                self.log(f"Folder exists: {folder_path}")
+
+                # There is nothing else to do
+                return
+
+            # Attempt to create the folder -- a single filesystem call
+            # which both checks for and creates the folder atomically,
+            # instead of a separate exists check followed by makedirs
+            try:
                 self.filelib.makedirs(folder_path)
 
-            # If it cannot be created
-            else:
+            # If the folder already exists
+            except FileExistsError:
 
-                self.log(f"Does not exist: {folder_path}")
+                self.log(f"Folder exists: {folder_path}")
 
-                # Mark this asset as incomplete
-                self.complete = False
+                # There is nothing else to do
+                return
 
-            # If any children were defined
-            if "children" in folder:
+            self.log(f"Creating {folder_path}")
 
-                # The children must be a list
-                msg = f"Children of each folder must be a list ({folder['children']})"
-                assert isinstance(folder["children"], list), msg
+        # If missing folders should just mark the asset as incomplete
+        else:
 
-                # Recursively check those subfolders
-                for child in folder["children"]:
+            # If the folder exists (checking the in-memory scan of the
+            # parent first, then the filesystem for any non-folder entry)
+            if (
+                existing is not None and folder["name"] in existing
+            ) or self.filelib.exists(folder_path):
 
-                    self.check_folders_recursive(
-                        base_path=folder_path,
-                        folder=child
-                    )
+                self.log(f"Folder exists: {folder_path}")
 
-        # If the folder does exist
-        else:
+                # There is nothing else to do
+                return
 
-            self.log(f"Folder exists: {folder_path}")
+            self.log(f"Does not exist: {folder_path}")
+
+            # Mark this asset as incomplete
+            self.complete = False
+
+        # At this point the folder did not previously exist
+
+        # If any children were defined
+        if "children" in folder:
+
+            # The children must be a list
+            msg = f"Children of each folder must be a list ({folder['children']})"
+            assert isinstance(folder["children"], list), msg
+
+            # Add those subfolders to the end of the queue
+            for child in folder["children"]:
+
+                folders_to_check.append((folder_path, child))
 
     def path(self, *subfolder_list) -> str:
         """Return the absolute path to a subfolder."""
 
-        return self.filelib.path_join(
-            self.base_path,
-            *list(subfolder_list)
-        )
+        # The subfolders are fixed, relative components of the workbench
+        # layout, so a plain string join skips the per-argument handling
+        # inside os.path.join -- this runs once per entry during walks
+        if len(subfolder_list) == 0:
+            return self.base_path
+
+        return self.base_path + "/" + "/".join(subfolder_list)
 
     def read_json(self, *subfolder_list):
 
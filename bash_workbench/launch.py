@@ -3,14 +3,41 @@
 
 import argcomplete
 from .args import make_parser
-from .filelib import FileLib
+from .filelib import FileLib, orjson
 from .logging import setup_logger
-from .menu import WorkbenchMenu
 from .workbench import Workbench
 import json
-import yaml
+import sys
 import os
 
+def print_json(r):
+    """Write a result to stdout in JSON format."""
+
+    # If orjson is available, encode directly to bytes and write them to
+    # the underlying buffer -- this avoids building the entire document
+    # as an intermediate Python string before printing it
+    if orjson is not None:
+
+        sys.stdout.buffer.write(orjson.dumps(r, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+
+    # Otherwise, stream the stdlib encoder directly into stdout, which
+    # writes each chunk as it is produced instead of joining them first
+    else:
+
+        json.dump(r, sys.stdout, indent=4)
+        sys.stdout.write("\n")
+
+def print_yaml(r):
+    """Write a result to stdout in YAML format."""
+
+    # Only pay the cost of importing yaml when the user actually asks
+    # for YAML output -- every other invocation skips it entirely
+    import yaml
+
+    print(yaml.dump(r))
+
 def cli():
     
     # Get the base parser for the CLI
@@ -31,22 +58,16 @@ def cli():
         # Set the location as ~/.workbench/
         args.base_folder = filelib.path_join(filelib.home(), "._workbench")
 
-    # If the base folder does not exist
-    if not os.path.exists(args.base_folder):
+    # Create the base folder, if it does not already exist
+    os.makedirs(args.base_folder, exist_ok=True)
 
-        # Create it
-        os.makedirs(args.base_folder)
-    
     assert args.profile is not None, "Must provide profile"
 
     # The home folder for the workbench is <base_folder>/<profile>/
     base_path = filelib.path_join(args.base_folder, args.profile)
 
-    # If the folder does not exist
-    if not filelib.exists(base_path):
-
-        # Create it
-        filelib.mkdir_p(base_path)
+    # Create the folder, if it does not already exist
+    filelib.mkdir_p(base_path)
 
     # Resolve the absolute path to the home folder
     base_path = filelib.abs_path(base_path)
@@ -70,6 +91,11 @@ def cli():
     # If the user did not provide any command to run
     if "func" not in args.__dict__:
 
+        # Only the interactive session needs the menu module -- deferring
+        # the import keeps it (and everything it pulls in) off the
+        # startup path of every other CLI command
+        from .menu import WorkbenchMenu
+
         # Start the interactive menu
         WorkbenchMenu(WB)
 
@@ -103,8 +129,8 @@ def cli():
             # method specified by the user
 
             print_funcs = dict(
-                json = lambda r: print(json.dumps(r, indent=4)),
-                yaml = lambda r: print(yaml.dump(r))
+                json = print_json,
+                yaml = print_yaml
             )
 
             # Invoke the function, falling back to print() for other types
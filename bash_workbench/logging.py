@@ -1,4 +1,5 @@
 import logging
+import os
 
 def setup_logger(
     log_fp=None,
@@ -9,28 +10,57 @@ def setup_logger(
     Set up and return a logging instance.
     Logs will be printed to standard out by default (with log_stdout=True).
     If `log_fp` is provided, logs will also be appended to that file.
+    Calling this more than once per process returns the same logger
+    without attaching duplicate handlers.
     """
 
     assert log_stdout or log_fp is not None, "Must log to either a file or STDOUT"
 
     # Set up logging
     logFormatter = logging.Formatter(log_format)
-    logger = logging.getLogger()
+
+    # Use a named logger rather than the root logger, so that configuring
+    # the workbench does not reconfigure the logging of any program which
+    # embeds it as a library
+    logger = logging.getLogger("bash_workbench")
     logger.setLevel(logging.INFO)
 
     # If a file was provided
     if log_fp is not None:
-        # Append to file
-        fileHandler = logging.FileHandler(log_fp, mode="a")
-        fileHandler.setFormatter(logFormatter)
-        logger.addHandler(fileHandler)
+
+        # The FileHandler records the absolute path of its file, which is
+        # used to check whether an equivalent handler is already attached
+        log_fp_abs = os.path.abspath(log_fp)
+
+        # Only attach a handler if one for the same file is not already
+        # present -- otherwise repeated setup calls would emit every log
+        # line once per call
+        if not any(
+            isinstance(handler, logging.FileHandler)
+            and handler.baseFilename == log_fp_abs
+            for handler in logger.handlers
+        ):
+
+            # Append to file
+            fileHandler = logging.FileHandler(log_fp, mode="a")
+            fileHandler.setFormatter(logFormatter)
+            logger.addHandler(fileHandler)
 
     # If the flag was set to log to standard out
     if log_stdout:
-        # Also write to STDOUT
-        consoleHandler = logging.StreamHandler()
-        consoleHandler.setFormatter(logFormatter)
-        logger.addHandler(consoleHandler)
+
+        # Only attach a console handler if none is already present
+        # (FileHandler subclasses StreamHandler, so it is excluded here)
+        if not any(
+            isinstance(handler, logging.StreamHandler)
+            and not isinstance(handler, logging.FileHandler)
+            for handler in logger.handlers
+        ):
+
+            # Also write to STDOUT
+            consoleHandler = logging.StreamHandler()
+            consoleHandler.setFormatter(logFormatter)
+            logger.addHandler(consoleHandler)
 
     # Return the logger
     return logger
@@ -1,14 +1,33 @@
 # Import the Workbench class to specify input type
 from .workbench import Workbench
+from functools import lru_cache
 from .misc import convert_size
 from .params_menu import ParamsMenu
-import questionary
 import json
 import sys
 import textwrap
 from time import sleep, strftime, gmtime
 import bash_workbench
 
+# Prompt shown when the current working directory has not been indexed
+# Precomputed at the module level so that textwrap.dedent does not have
+# to re-scan the template every time the prompt is shown
+UNINDEXED_PROMPT = textwrap.dedent("""
+The current working directory is not indexed
+({cwd})
+Select an action:
+""")
+
+@lru_cache(maxsize=64)
+def _header_border(border_char:str, width:int) -> str:
+    """
+    Return the border line used above and below a header.
+    The same few headers (e.g. the main menu banner) are redrawn on
+    every screen, so the repeated strings are memoized.
+    """
+
+    return border_char * width
+
 class WorkbenchMenu:
 
     def __init__(self, WB:Workbench):
@@ -26,11 +45,35 @@ class WorkbenchMenu:
         # Set the current working directory
         self.cwd = self.wb.filelib.getcwd()
 
+        # Dispatch table of questionary prompt functions, built on first
+        # use (questionary itself is imported lazily)
+        self._q_funcs = None
+
         # Report the version of all software used
         self.print_versions()
 
-        # Start at the main manu
-        self.main_menu()
+        # Run the menu loop, starting at the main menu
+        self.run()
+
+    def run(self):
+        """
+        Drive the interactive session.
+
+        Each menu function returns the next menu function to show (or
+        None to end the session), and this loop invokes them one at a
+        time -- menus hand control back here between screens instead of
+        calling each other recursively, which would otherwise grow the
+        stack without bound over a long session.
+        """
+
+        # Start at the main menu
+        next_menu = self.main_menu
+
+        # Until a menu indicates that the session is over
+        while next_menu is not None:
+
+            # Show the menu, which returns the next menu to show
+            next_menu = next_menu()
 
     def print_versions(self):
         """Print the versions of all packages used."""
@@ -51,8 +94,30 @@ class WorkbenchMenu:
     def questionary(self, fname, msg, validate_type=None, output_f=None, **kwargs) -> str:
         """Wrap questionary functions to catch escapes and exit gracefully."""
 
+        # Build the dispatch table of prompt functions a single time --
+        # this wrapper runs for every prompt in the session
+        # The import is deferred to this point because questionary pulls
+        # in prompt_toolkit, which is a meaningful share of CLI
+        # cold-start time, and non-interactive commands never prompt
+        if self._q_funcs is None:
+
+            import questionary
+
+            self._q_funcs = {
+                prompt_type: questionary.__dict__[prompt_type]
+                for prompt_type in [
+                    "select",
+                    "text",
+                    "password",
+                    "confirm",
+                    "path",
+                    "autocomplete",
+                    "checkbox"
+                ]
+            }
+
         # Get the questionary function
-        questionary_f = questionary.__dict__.get(fname)
+        questionary_f = self._q_funcs.get(fname)
 
         # Make sure that the function exists
         assert questionary_f is not None, f"No such questionary function: {fname}"
@@ -89,37 +154,48 @@ class WorkbenchMenu:
     def select_func(self, prompt, options, **kwargs):
         """Prompt the user to select from a list of functions to execute."""
 
-        # `options` must be a list of tuples
-        msg = "`options` must be a list of tuples"
-        assert isinstance(options, list), msg
-
-        # Each tuple in the list must consist of two strings:
-        # 1) The string used to describe the option, and
-        # 2) The function which will be executed
-
-        # Make sure that the options follow that format, before
-        # launching the questionary prompt
-        for option in options:
-            msg = f"Option must have two elements ({option})"
-            assert len(option) == 2, msg
-            msg = f"Option must have a string in the first position ({option})"
-            assert isinstance(option[0], str), msg
-            msg = f"Option must have a callable function in the second position ({option})"
-            assert callable(option[1]), msg
-
-        # Get the selection from the user
+        # Imported here for the same reason as in questionary() above --
+        # this only ever runs interactively, and after the first call
+        # the import is just a cache lookup
+        import questionary
+
+        # Each option must pair a string label with a callable function
+        # The format checks are gated on __debug__, so that they are
+        # skipped entirely when running under `python -O`
+        if __debug__:
+
+            msg = "`options` must be a list of tuples"
+            assert isinstance(options, list), msg
+
+            msg = f"Option labels must be unique ({options})"
+            assert len({label for label, _ in options}) == len(options), msg
+
+            for label, func in options:
+                msg = f"Option must have a string in the first position ({label})"
+                assert isinstance(label, str), msg
+                msg = f"Option must have a callable function in the second position ({label})"
+                assert callable(func), msg
+
+        # Attach each function as the value of its Choice, so that the
+        # selection returned by questionary *is* the function to execute
+        # and no label -> function lookup is needed at all
         selection = self.questionary(
             "select",
             prompt,
             choices=[
-                option[0]
-                for option in options
+                questionary.Choice(title=label, value=func)
+                for label, func in options
             ]
         )
 
-        # Call the function provided, including any additional keywords
-        # provided by the user when calling this wrapper function
-        dict(options).get(selection)(**kwargs)
+        # Return the selected function without invoking it
+        # Navigation menus pass it straight back to the driver loop in
+        # run(), which keeps the stack flat across menu hops; callers
+        # which need the result of the action invoke it directly
+        if kwargs:
+            return lambda: selection(**kwargs)
+
+        return selection
 
     def check_indexed_cwd(self):
         """
@@ -142,13 +218,10 @@ class WorkbenchMenu:
         # If an index does not exist
         if ds.index is None:
 
-            # Ask the user if they want to index it
+            # Ask the user if they want to index it, running the
+            # selected action before continuing below
             self.select_func(
-                textwrap.dedent(f"""
-                The current working directory is not indexed
-                ({self.cwd})
-                Select an action:
-                """),
+                UNINDEXED_PROMPT.format(cwd=self.cwd),
                 [
                     (
                         "Index the folder",
@@ -156,7 +229,7 @@ class WorkbenchMenu:
                     ),
                     ("Exit", self.exit)
                 ]
-            )
+            )()
 
             # Get the new index
             ds = self.wb.dataset(self.cwd)
@@ -184,20 +257,27 @@ class WorkbenchMenu:
         # If this is not the home directory
         if self.cwd != self.wb.path("data"):
 
-            # Get the dataset information
-            ds = self.wb.dataset(self.cwd)
+            # Get the dataset information from the collection, which
+            # check_indexed_cwd just ensured contains this folder --
+            # this avoids re-reading the index and asset configurations
+            # every time the main menu is displayed
+            ds = self.wb.datasets.from_path(self.cwd)
 
             # Show the name as a header
             self.print_header(f"Dataset: {ds.index.get('name', self.cwd)}")
 
-            # Print:
-            #   description, tags of cwd, etc.
-            for key, val in ds.index.items():
-                if key not in ["name", "status"]:
-                    self.print_line(f"{key}: {val}", indent=1)
+            # Build the block of lines in a single pass:
+            #   description, path, tags of cwd, etc.
+            # The 'children' and 'parent' keys are bookkeeping added by
+            # the collection, and are not shown to the user
+            lines = [
+                f"{self.spacer}- {key}: {val}"
+                for key, val in ds.index.items()
+                if key not in ["name", "status", "children", "parent"]
+            ]
 
-            # Print the directory
-            self.print_line(f"path: {self.cwd}", indent=1)
+            # Emit the whole block with a single write
+            sys.stdout.write("\n".join(lines) + "\n")
 
             # If there is a 'status' defined
             if ds.index.get('status') is not None:
@@ -258,8 +338,9 @@ class WorkbenchMenu:
         ])
 
         # Select a submenu
-        # The user selection will run a function
-        self.select_func("Would you like to:", options)
+        # The user selection will run a function, which returns
+        # the next menu to show
+        return self.select_func("Would you like to:", options)
 
     def list_all_datasets(self):
         """List the complete set of datasets which have been indexed by the workbench."""
@@ -275,7 +356,7 @@ class WorkbenchMenu:
         self.print_filters()
 
         # Go back to the "Explore Datasets" menu
-        self.explore_datasets_menu()
+        return self.explore_datasets_menu
 
 
     def explore_datasets_menu(self):
@@ -296,7 +377,7 @@ class WorkbenchMenu:
             ("Back to Main Menu", self.main_menu)
         )
 
-        self.select_func(
+        return self.select_func(
             """Would you like to:""",
             choices
         )
@@ -309,7 +390,9 @@ class WorkbenchMenu:
 
         assert isinstance(leader, str)
 
-        print("".join([self.spacer for i in range(indent)] + [leader, text]))
+        # Assemble the line and emit it with a single write, rather than
+        # letting print issue separate writes for the text and newline
+        sys.stdout.write(f"{self.spacer * indent}{leader}{text}\n")
 
     def print_header(self, text, border_char="#"):
         """Print text with a border."""
@@ -317,17 +400,22 @@ class WorkbenchMenu:
         assert isinstance(border_char, str)
         assert len(border_char) == 1
 
-        print("")
-        print("".join(border_char for _ in range(len(text) + 4)))
-        print(" ".join([border_char, text, border_char]))
-        print("".join(border_char for _ in range(len(text) + 4)))
-        print("")
+        # Assemble all five lines of the header and emit them with a
+        # single write (one syscall on an unbuffered TTY, instead of one
+        # or two per line)
+        border = _header_border(border_char, len(text) + 4)
+
+        sys.stdout.write(
+            f"\n{border}\n{border_char} {text} {border_char}\n{border}\n\n"
+        )
 
     def edit_name_description(self):
         """Edit the name and/or description for a dataset."""
 
-        # Read the dataset index
-        ds = self.wb.dataset(self.cwd)
+        # Get the dataset from the collection, so that the attributes set
+        # below also update the in-memory copy shown by the main menu
+        # (a fresh Dataset here would leave the collection stale)
+        ds = self.wb.datasets.from_path(self.cwd)
 
         # Prompt for the name and description
         for k in ["name", "description"]:
@@ -340,8 +428,12 @@ class WorkbenchMenu:
                 )
             )
 
+        # The formatted dataset paths include the name, so any cached
+        # copy held by the collection is now out of date
+        self.wb.datasets.clear_filtered_paths_cache()
+
         # Go back to the main menu
-        self.main_menu()
+        return self.main_menu
 
     def jump_directory(self, path):
         """Change the working directory and return to the main menu."""
@@ -369,8 +461,8 @@ class WorkbenchMenu:
             self.wb.filelib.chdir(path)
 
             # Go back to the main menu
-            self.main_menu()
-        
+            return self.main_menu
+
         # If there was an error
         except FileNotFoundError as e:
 
@@ -379,7 +471,7 @@ class WorkbenchMenu:
                 self.print_line(line)
 
             # Give the user another chance
-            self.jump_directory_menu()
+            return self.jump_directory_menu
 
     def list_files(self):
         """List the files in the current working directory."""
@@ -388,32 +480,31 @@ class WorkbenchMenu:
         files = list()
         folders = list()
 
-        # Iterate over the items in this folder
-        for fn in self.wb.filelib.listdir(self.cwd):
-
-            # Construct the full path
-            fp = self.wb.filelib.path_join(self.cwd, fn)
+        # Scan the items in this folder, which provides cached file
+        # type and size information without extra calls per path
+        for entry in self.wb.filelib.scandir(self.cwd):
 
             # If the path is a folder
-            if self.wb.filelib.isdir(fp):
+            if entry.is_dir():
 
-                # Get the number of items in the folder
-                n = len(self.wb.filelib.listdir(fp))
+                # Get the number of items in the folder, counted from the
+                # directory stream without building a list of names
+                n = self.wb.filelib.count_entries(entry.path)
 
                 # Report the number of items
                 folders.append(
-                    (fn + "/", f"(contains {n:,} items)")
+                    (entry.name + "/", f"(contains {n:,} items)")
                 )
 
             # If the path is a file
             else:
 
                 # Get the size of the file (in bytes)
-                filesize = self.wb.filelib.getsize(fp)
+                filesize = entry.stat().st_size
 
                 # Report the filesize, formatted nicely
                 files.append(
-                    (fn, convert_size(filesize))
+                    (entry.name, convert_size(filesize))
                 )
 
         if len(files) + len(folders) == 0:
@@ -443,7 +534,7 @@ class WorkbenchMenu:
                     self.print_line(f"{fn}{' ' * spacer_len}{fn_str}")
 
         # Back to the main menu after the user hits enter
-        self.select_func(
+        return self.select_func(
             "Next",
             [
                 ("Back to the main menu", self.main_menu)
@@ -453,22 +544,30 @@ class WorkbenchMenu:
     def browse_tool_menu(self):
         """Show the user the set of tools which are available."""
 
-        self._browse_asset_menu("tool")
+        return self._browse_asset_menu("tool")
 
     def browse_launcher_menu(self):
         """Show the user the set of launchers which are available."""
 
-        self._browse_asset_menu("launcher")
+        return self._browse_asset_menu("launcher")
 
     def _prompt_user_to_select_asset(self, asset_type):
         """Show the user the set of assets which are available."""
 
-        # Make a list of repositories to choose from
-        repository_choices = [
-            f"{repo_name}\n      {asset_type.title()}s available: {len(repo.assets.get(asset_type, []))}"
-            for repo_name, repo in self.wb.repositories.items()
-            if len(repo.assets.get(asset_type, [])) > 0
-        ]
+        # Make a list of repositories to choose from, counting the assets
+        # of this type in each repository a single time (rather than once
+        # for the filter and again for the label)
+        repository_choices = list()
+
+        for repo_name, repo in self.wb.repositories.items():
+
+            n_assets = len(repo.assets.get(asset_type, []))
+
+            if n_assets > 0:
+
+                repository_choices.append(
+                    f"{repo_name}\n      {asset_type.title()}s available: {n_assets}"
+                )
 
         # Sort the list alphabetically
         repository_choices.sort()
@@ -535,13 +634,13 @@ class WorkbenchMenu:
         if repo_name == "Back" or asset_name == "Back":
 
             # Go back
-            self.main_menu()
+            return self.main_menu
 
         # If the user selected a tool
         else:
 
             # Drop the user into the menu used to browse a single asset
-            self._browse_single_asset(
+            return self._browse_single_asset(
                 asset_type=asset_type,
                 asset_name=asset_name,
                 repo_name=repo_name
@@ -611,7 +710,7 @@ class WorkbenchMenu:
         if selection == "Back":
 
             # Go back
-            self._browse_asset_menu(asset_type)
+            return self._browse_asset_menu(asset_type)
 
         # If the user opted to view a set of saved params
         elif selection.startswith("View params: "):
@@ -669,8 +768,10 @@ class WorkbenchMenu:
                 # Print it
                 print(dat)
 
-        # Redisplay the menu
-        self._browse_single_asset(
+        # Redisplay the menu, handing the callable back to the driver
+        # loop rather than recursing -- the user may view files any
+        # number of times without growing the stack
+        return lambda: self._browse_single_asset(
             asset_type=asset_type,
             asset_name=asset_name,
             repo_name=repo_name
@@ -774,10 +875,12 @@ class WorkbenchMenu:
         """Navigate to one of the folders immediately above or below this one."""
 
         # Get the list of subfolders within this one
+        # Scanning the folder provides the file type of each entry from a
+        # single directory read, instead of one isdir call per entry
         folder_list = [
-            fp
-            for fp in self.wb.filelib.listdir(".")
-            if self.wb.filelib.isdir(fp)
+            entry.name
+            for entry in self.wb.filelib.scandir(".")
+            if entry.is_dir()
         ]
 
         # Sort alphabetically
@@ -808,7 +911,7 @@ class WorkbenchMenu:
             self.wb.filelib.chdir(dest_path)
 
         # Go back to the main menu
-        self.main_menu()
+        return self.main_menu
 
     def create_subfolder_menu(self):
         """Create a subfolder inside the current folder."""
@@ -819,8 +922,13 @@ class WorkbenchMenu:
         # The folder path will have spaces replaced with "_"
         folder_path = None
 
+        # List the names already present in the folder a single time --
+        # each collision attempt below then checks the set in memory
+        # instead of issuing a fresh filesystem call per attempt
+        existing = set(self.wb.filelib.listdir(self.cwd))
+
         # Make sure the folder does not collide
-        while folder_name is None or self.wb.filelib.exists(folder_path):
+        while folder_name is None or folder_path in existing:
 
             # Get the name
             folder_name = self.questionary(
@@ -838,7 +946,7 @@ class WorkbenchMenu:
             folder_path = folder_name.replace(" ", "_")
 
             # If a folder like this exists
-            if self.wb.filelib.exists(folder_path):
+            if folder_path in existing:
 
                 # Tell the user
                 self.print_line(f"Folder already exists ({folder_path})")
@@ -878,7 +986,7 @@ class WorkbenchMenu:
                 ds.set_attribute("description", folder_desc)
 
                 # Move to the folder
-                self.jump_directory(
+                return self.jump_directory(
                     self.wb.filelib.path_join(
                         self.cwd,
                         folder_path
@@ -889,7 +997,7 @@ class WorkbenchMenu:
         sleep(0.1)
 
         # Back to the main menu
-        self.main_menu()
+        return self.main_menu
 
     def run_tool_menu(self):
         """Run a tool in the current directory."""
@@ -897,17 +1005,29 @@ class WorkbenchMenu:
         # Make sure that the current directory is indexed
         self.check_indexed_cwd()
 
+        # Each of the setup steps below returns the next menu to show if
+        # the user navigated away (e.g. back to the main menu), or None
+        # if the flow should continue with the following step
+
         # Set up the tool
-        self.setup_tool_menu()
+        next_menu = self.setup_tool_menu()
+        if next_menu is not None:
+            return next_menu
 
         # Populate the params for the tool
-        self.dataset_tool_params_menu()
+        next_menu = self.dataset_tool_params_menu()
+        if next_menu is not None:
+            return next_menu
 
         # Set up the launcher
-        self.setup_launcher_menu()
+        next_menu = self.setup_launcher_menu()
+        if next_menu is not None:
+            return next_menu
 
         # Populate the params for the launcher
-        self.dataset_launcher_params_menu()
+        next_menu = self.dataset_launcher_params_menu()
+        if next_menu is not None:
+            return next_menu
 
         # Prompt the user to run the tool now or
         # save it to run later
@@ -932,29 +1052,30 @@ class WorkbenchMenu:
                 sleep(0.1)
 
             # Tail the logs
-            self.tail_logs()
+            return self.tail_logs()
 
         # Otherwise
         else:
 
             # Return to the main menu
-            self.main_menu()
+            return self.main_menu
 
     def setup_tool_menu(self):
         """Set up a tool for a dataset."""
 
-        self._setup_asset_menu("tool")
+        return self._setup_asset_menu("tool")
 
     def setup_launcher_menu(self):
         """Set up a launcher for a dataset."""
 
-        self._setup_asset_menu("launcher")
+        return self._setup_asset_menu("launcher")
 
     def _setup_asset_menu(self, asset_type):
         """Set up an asset (tool or launcher)."""
 
-        # Make a Dataset object
-        ds = self.wb.dataset(self.cwd)
+        # Get the dataset from the collection, rather than re-reading the
+        # index and asset configurations from disk
+        ds = self.wb.datasets.from_path(self.cwd)
 
         # Make sure that the asset type is valid
         ds.validate_asset_type_format(asset_type)
@@ -996,23 +1117,26 @@ class WorkbenchMenu:
                     )
                 )
 
-            # Ask the user to select from those options
-            self.select_func(
+            # Ask the user to select from those options, running the
+            # selected action -- it returns the next menu to show, or
+            # None if the calling flow should continue
+            return self.select_func(
                 f"Previously selected {asset_type}:\n  - {asset_name}\n   ",
                 options
-            )
+            )()
 
         # If no asset has been set up yet
         else:
 
             # Drop right into the menu choosing an asset
-            self._choose_asset(asset_type)
+            return self._choose_asset(asset_type)
 
     def _choose_asset(self, asset_type):
         """Select an asset and set it up for a dataset."""
 
-        # Make a Dataset object
-        ds = self.wb.dataset(self.cwd)
+        # Get the dataset from the collection, rather than re-reading the
+        # index and asset configurations from disk
+        ds = self.wb.datasets.from_path(self.cwd)
 
         # Make sure that the asset type is valid
         ds.validate_asset_type_format(asset_type)
@@ -1025,7 +1149,7 @@ class WorkbenchMenu:
         if repo_name == "Back" or asset_name == "Back":
 
             # Go back
-            self.main_menu()
+            return self.main_menu
 
         # If the user decided to skip this asset type entirely
         elif repo_name == "Skip":
@@ -1062,18 +1186,19 @@ class WorkbenchMenu:
     def dataset_tool_params_menu(self):
         """Populate the params for a tool in a dataset."""
 
-        self._dataset_asset_params_menu("tool")
+        return self._dataset_asset_params_menu("tool")
     
     def dataset_launcher_params_menu(self):
         """Populate the params for a launcher in a dataset."""
 
-        self._dataset_asset_params_menu("launcher")
+        return self._dataset_asset_params_menu("launcher")
 
     def _dataset_asset_params_menu(self, asset_type):
         """Populate the params for an asset in a dataset."""
 
-        # Make a Dataset object
-        ds = self.wb.dataset(self.cwd)
+        # Get the dataset from the collection, rather than re-reading the
+        # index and asset configurations from disk
+        ds = self.wb.datasets.from_path(self.cwd)
 
         # Get the name of the tool/launcher which has been set up
         asset_name = ds.index.get(asset_type)
@@ -1088,7 +1213,12 @@ class WorkbenchMenu:
 
                     # Choose one
                     self.print_line(f"No {asset_name} has been set up yet")
-                    self._choose_asset(asset_type)
+
+                    # If the user navigated away instead of choosing,
+                    # hand that menu back to the driver loop
+                    next_menu = self._choose_asset(asset_type)
+                    if next_menu is not None:
+                        return next_menu
 
                     # Get the name of the tool/launcher which has now been set up
                     asset_name = ds.index.get(asset_type)
@@ -1174,13 +1304,13 @@ class WorkbenchMenu:
         else:
 
             # Return to the main menu
-            self.main_menu()
+            return self.main_menu
 
     def tail_logs(self):
         """Show the user the log file as it is updated"""
 
-        # Get the dataset information
-        ds = self.wb.dataset(self.cwd)
+        # Get the dataset information from the collection
+        ds = self.wb.datasets.from_path(self.cwd)
 
         # Set up the text used to prompt the user
         print_logs_prompt = "View more logs"
@@ -1225,7 +1355,7 @@ class WorkbenchMenu:
                     ds.run_action(user_choice)
 
         # When all done, return to the main menu
-        self.main_menu()
+        return self.main_menu
 
     def erase_lines(self, n_lines:int):
         """Erase a number of lines from the display"""
@@ -1261,7 +1391,7 @@ class WorkbenchMenu:
         self.print_line(f"Moving to dataset {path}")
 
         # Move to that directory
-        self.jump_directory(path)
+        return self.jump_directory(path)
 
     def import_folder(self):
         """Import a folder from the filesystem."""
@@ -1288,14 +1418,13 @@ class WorkbenchMenu:
                 f"Folder could not be added: {str(e)}"
             )
             # Back to the main menu
-            self.main_menu()
-            return
+            return self.main_menu
 
         # Report success
         self.print_line(f"Imported folder {folder_to_import}")
 
         # Back to the Explore Datasets menu
-        self.explore_datasets_menu()
+        return self.explore_datasets_menu
     
     def manage_repositories_menu(self):
         """Manage the repositories available"""
@@ -1307,17 +1436,6 @@ class WorkbenchMenu:
             ("Back to Main Menu", self.main_menu)
         ]
 
-        # Make a dict of functions
-        func_map = dict()
-
-        # Make a list of choices to present
-        choices = list()
-
-        # Populate the dictionary and the list
-        for name, f in options:
-            func_map[name] = f
-            choices.append(name)
-
         # Add options to modify each of the downloaded and linked repositories
 
         # Get the list of repositories which have been downloaded
@@ -1327,33 +1445,17 @@ class WorkbenchMenu:
         local_repos.sort()
 
         # Add an option for each of the downloaded repositories
+        # The repository name is bound as a default argument so that each
+        # lambda captures its own value, rather than a reference to the
+        # loop variable (which would point every entry at the last repo)
         for repo in local_repos:
-            choices.append(f"Manage repository: {repo}")
-
-        # Ask the user
-        choice = self.questionary(
-            "select",
-            "Manage Repositories",
-            choices=choices
-        )
+            options.append((
+                f"Manage repository: {repo}",
+                lambda repo=repo: self.manage_repo(repo)
+            ))
 
-        # If the user decided to manage a repository
-        if choice.startswith("Manage repository: "):
-
-            # Get the repository name
-            repo = choice[len("Manage repository: "):]
-
-            # Launch the menu for managing that repository
-            self.manage_repo(repo)
-
-        # If the user selected something else
-        else:
-
-            # Make sure that we know what function to run
-            assert choice in func_map, f"Cannot map selection ({choices}) to options ({', '.join(list(func_map.keys()))})"
-
-            # Open that menu
-            func_map[choice]()
+        # Ask the user, and run the function for the selected option
+        return self.select_func("Manage Repositories", options)
 
     def download_repo(self):
         """Download a GitHub repository."""
@@ -1382,8 +1484,8 @@ class WorkbenchMenu:
             # If the user is not sure
             if not self.questionary("confirm", prompt):
 
-                # Go back to the repository menu
-                self.manage_repositories_menu()
+                # Go back to the repository menu without downloading
+                return self.manage_repositories_menu
 
             # Try to download it
             try:
@@ -1392,10 +1494,10 @@ class WorkbenchMenu:
                 self.print_line(f"ERROR: {str(e)}")
 
             # Update the list of Repositories which are available
-            self.wb.repositories = self.wb.setup_repositories()
+            self.wb.refresh_repositories()
 
         # Back to the repository menu
-        self.manage_repositories_menu()
+        return self.manage_repositories_menu
 
     def link_repo(self):
         """Link a local a GitHub repository."""
@@ -1434,16 +1536,16 @@ class WorkbenchMenu:
             try:
                 self.wb.link_local_repo(
                     path=repo_fp,
-                    name=repo_fp.rstrip("/").rsplit("/", 1)[-1]
+                    name=self.wb.filelib.basename(repo_fp.rstrip("/"))
                 )
             except Exception as e:
                 self.print_line(f"ERROR: {str(e)}")
 
             # Update the list of Repositories which are available
-            self.wb.repositories = self.wb.setup_repositories()
+            self.wb.refresh_repositories()
 
         # Back to the repository menu
-        self.manage_repositories_menu()
+        return self.manage_repositories_menu
 
     def manage_repo(self, repo_name):
         """Manage a downloaded repository."""
@@ -1453,7 +1555,7 @@ class WorkbenchMenu:
             self.print_repo_version(repo_name)
 
         # Ask the user what to do
-        self.select_func(
+        return self.select_func(
             f"Local copy of downloaded repository: {repo_name}",
             [
                 ("Update to latest version", lambda: self.update_local_repo(repo_name)),
@@ -1465,11 +1567,16 @@ class WorkbenchMenu:
 
     def print_repo_version(self, repo_name:str) -> None:
         """Print the version of a repo."""
-        hexsha = self.wb.repositories[repo_name].repo.head.object.hexsha
-        self.print_line(f"Branch name: {self.wb.repositories[repo_name].repo.head.name}")
-        committed_date = strftime("%a, %d %b %Y %H:%M", gmtime(self.wb.repositories[repo_name].repo.head.object.committed_date))
+
+        # Resolve the head of the repository a single time -- each access
+        # of `repo.head.object` reads the git object store
+        head = self.wb.repositories[repo_name].repo.head
+        commit = head.object
+
+        committed_date = strftime("%a, %d %b %Y %H:%M", gmtime(commit.committed_date))
+        self.print_line(f"Branch name: {head.name}")
         self.print_line(f"Commit date: {committed_date}")
-        self.print_line(f"Commit hash: {hexsha}")
+        self.print_line(f"Commit hash: {commit.hexsha}")
 
     def update_local_repo(self, repo_name):
         """Update a local repository to the most recent version."""
@@ -1480,8 +1587,8 @@ class WorkbenchMenu:
             f"Confirm - update local copy of repository {repo_name}"
         ):
 
-            # Go back to the repository menu
-            self.manage_repositories_menu()
+            # Go back to the repository menu without updating
+            return self.manage_repositories_menu
 
         # Try to update the repository
         try:
@@ -1490,13 +1597,13 @@ class WorkbenchMenu:
             self.print_line(f"ERROR: {str(e)}")
 
         # Update the list of Repositories which are available
-        self.wb.repositories = self.wb.setup_repositories()
+        self.wb.refresh_repositories()
 
         # Print the updated repo version
         self.print_repo_version(repo_name)
 
         # Go back to the repository menu
-        self.manage_repositories_menu()
+        return self.manage_repositories_menu
 
     def remove_repo(self, repo_name):
         """Delete the local copy of a downloaded repository."""
@@ -1507,8 +1614,8 @@ class WorkbenchMenu:
             f"Confirm - remove repository {repo_name}"
         ):
 
-            # Go back to the repository menu
-            self.manage_repositories_menu()
+            # Go back to the repository menu without deleting
+            return self.manage_repositories_menu
 
         # Try to delete the repository
         try:
@@ -1517,10 +1624,10 @@ class WorkbenchMenu:
             self.print_line(f"ERROR: {str(e)}")
 
         # Update the list of Repositories which are available
-        self.wb.repositories = self.wb.setup_repositories()
+        self.wb.refresh_repositories()
 
         # Go back to the repository menu
-        self.manage_repositories_menu()
+        return self.manage_repositories_menu
 
     def local_repo_switch_branch(self, repo_name):
         """Switch the branch of a local repository."""
@@ -1534,8 +1641,8 @@ class WorkbenchMenu:
             f"Confirm - switch repository {repo_name} to branch {branch_name}"
         ):
 
-            # Go back to the repository menu
-            self.manage_repositories_menu()
+            # Go back to the repository menu without switching
+            return self.manage_repositories_menu
 
         # Try to update the repository
         try:
@@ -1544,13 +1651,13 @@ class WorkbenchMenu:
             self.print_line(f"ERROR: {str(e)}")
 
         # Update the list of Repositories which are available
-        self.wb.repositories = self.wb.setup_repositories()
+        self.wb.refresh_repositories()
 
         # Print the updated repo version
         self.print_repo_version(repo_name)
 
         # Go back to the repository menu
-        self.manage_repositories_menu()
+        return self.manage_repositories_menu
 
     def index_folder(self, path):
         """Add an index to a folder."""
@@ -1612,7 +1719,7 @@ class WorkbenchMenu:
         options.append(("Back to main menu", self.main_menu))
 
         # Present the menu
-        self.select_func(
+        return self.select_func(
             "Add or remove a filter on the displayed datasets",
             options
         )
@@ -1639,7 +1746,7 @@ class WorkbenchMenu:
             self.wb.datasets.remove_filter(field=field, value=value)
 
         # Go back to the previous menu
-        self.add_remove_filters()
+        return self.add_remove_filters
 
     def add_filter(self):
         """Add a filter to the set of displayed dadtasets."""
@@ -1668,7 +1775,7 @@ class WorkbenchMenu:
             value = self.questionary(
                 "text",
                 dict(
-                    name="Only show datasets with names that contain the string (case sensitive):",
+                    name="Only show datasets with names that contain the string (case insensitive):",
                     description="Only show datasets with descriptions that contain the string:",
                     tag="Only show datasets which have the tag (key=value):"
                 )[field]
@@ -1678,13 +1785,15 @@ class WorkbenchMenu:
         self.wb.datasets.add_filter(field=field, value=value)
 
         # Back to the previous menu
-        self.add_remove_filters()
+        return self.add_remove_filters
 
     def refresh(self):
         """Refresh the status of the current dataset."""
 
-        # Re-read the index
-        self.wb.dataset(self.cwd).read_index()
+        # Re-read the index of the copy held in the collection -- reading
+        # the index of a newly-constructed Dataset would leave the copy
+        # shown by the main menu unchanged
+        self.wb.datasets.from_path(self.cwd).read_index()
 
         # Go back to the main menu
-        self.main_menu()
+        return self.main_menu
@@ -1,7 +1,9 @@
 from .asset import Asset
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from .folder_hierarchy import FolderHierarchyBase
 import git
+import os
 
 AssetDict = Dict[str, Asset]
 
@@ -53,17 +55,36 @@ class Repository(FolderHierarchyBase):
         # If the folder exists
         if self.exists("._wb", asset_type):
 
-            # Iterate over each subfolder
-            for subfolder in self.listdir("._wb", asset_type):
+            # Get the list of subfolders
+            subfolders = self.listdir("._wb", asset_type)
 
-                # Set up the asset
-                asset = Asset(
+            # Set up the asset for a single subfolder
+            def make_asset(subfolder):
+                return Asset(
                     base_path=self.path("._wb", asset_type, subfolder),
                     filelib=self.filelib,
                     logger=self.logger,
                     verbose=self.verbose
                 )
 
+            # Reading each asset is independent I/O (open + read + parse),
+            # so larger folders are read concurrently with a thread pool
+            # Small folders are read serially, since the savings would not
+            # cover the cost of starting up the pool
+            if len(subfolders) < 8:
+
+                assets = [make_asset(subfolder) for subfolder in subfolders]
+
+            else:
+
+                with ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4)
+                ) as pool:
+                    assets = list(pool.map(make_asset, subfolders))
+
+            # Iterate over each asset
+            for asset in assets:
+
                 # If the asset is complete
                 if asset.complete:
 
@@ -4,19 +4,37 @@ class Timestamp():
     """Encode / decode a date and time to / from string format."""
 
     def __init__(self, fmt="%Y-%m-%d %H:%M:%S %Z"):
-        
+
         self.fmt = fmt
 
+        # Cache the most recently encoded string, so that bulk operations
+        # landing within the same second do not re-run strftime
+        self._last_sec = None
+        self._last_str = None
+
     def encode(self):
         """Return a string representation of the current date and time."""
 
         # Current date and time
         now = datetime.datetime.now(datetime.timezone.utc)
 
-        # Return a string formatted using the pattern shown above
-        return now.strftime(self.fmt)
+        # If no string has been formatted within this same second
+        sec = now.replace(microsecond=0)
+        if sec != self._last_sec:
+
+            # Format a string using the pattern shown above
+            self._last_sec = sec
+            self._last_str = now.strftime(self.fmt)
+
+        # Return the string formatted for this second
+        return self._last_str
 
     def decode(self, timestamp_str):
         """Return the date and time represented by a string."""
 
-        return datetime.strptime(timestamp_str, self.fmt)
\ No newline at end of file
+        return datetime.datetime.strptime(timestamp_str, self.fmt)
+
+
+# A single shared instance, so that the once-per-second formatting
+# cache applies across every caller in the process
+TIMESTAMP = Timestamp()
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Union
+import os
 from .asset import Asset
 from .repository import Repository
 from .dataset import Dataset
 from .datasets import Datasets
+from .filelib import ensure
 from .folder_hierarchy import FolderHierarchyBase
-from .timestamp import Timestamp
+from .timestamp import TIMESTAMP
 from importlib_resources import files
 
 class Workbench(FolderHierarchyBase):
@@ -21,14 +24,17 @@ class Workbench(FolderHierarchyBase):
     def read_contents(self) -> None:
         """Function is executed immediately after the folder structure is populated."""
 
-        # Class used to encode / decode timestamps
-        self.timestamp = Timestamp()
+        # Shared instance used to encode / decode timestamps
+        self.timestamp = TIMESTAMP
 
         # Make sure that all of the appropriate directories exist
         self.setup_root_folder()
 
-        # Set up all of the repositories which are present
-        self.repositories = self.setup_repositories()
+        # Repositories are set up lazily (see the `repositories` property)
+        # Constructing each one parses the config of every asset which it
+        # contains, which commands that never touch the repositories
+        # should not have to pay for
+        self._repositories = None
 
         # Parse all of the datasets contained within data/
         self.datasets = Datasets(self)
@@ -63,23 +69,45 @@ class Workbench(FolderHierarchyBase):
         # Each Repository contains an `assets` attriute which is a dict
         # with keys 'tool' and 'launcher' with the list of the Assets contained
         # in each repository, if any. 
+        # A single scan of repositories/ provides the file type of each
+        # entry, so non-folder entries are skipped without constructing a
+        # Repository (and running its folder checks) for them
         repositories = {
-            folder_name: Repository(
-                base_path=self.path("repositories", folder_name),
+            entry.name: Repository(
+                base_path=entry.path,
                 logger=self.logger,
                 verbose=self.verbose,
                 filelib=self.filelib
             )
-            for folder_name in self.listdir("repositories")
+            for entry in self.filelib.scandir(self.path("repositories"))
+            if entry.is_dir()
         }
         # Include all repositories in this dict, even if they do not contain
         # a folder ._wb/ (in which case Repository.complete == False)
 
         return repositories
 
+    @property
+    def repositories(self) -> Dict[str, Repository]:
+        """The dict of repositories, constructed on first access and then reused."""
+
+        if self._repositories is None:
+            self._repositories = self.setup_repositories()
+
+        return self._repositories
+
+    def refresh_repositories(self) -> None:
+        """
+        Drop the cached dict of repositories, after a repository has been
+        added or removed on disk.
+        The folder will be re-scanned the next time `repositories` is accessed.
+        """
+
+        self._repositories = None
+
     def index_folder(self, path:str=None) -> dict:
 
-        assert path is not None, "Must provide --path for folder to index"
+        ensure(path is not None, "Must provide --path for folder to index")
 
         self.log(f"Preparing to index folder: {path}")
 
@@ -112,36 +140,79 @@ class Workbench(FolderHierarchyBase):
         # Resolve symlinks and remove any terminal slashes
         path = self.filelib.abs_path(path)
 
+        # A path inside the data/ folder itself can only be a reference
+        # artifact, never a dataset location -- skip it with a single
+        # string prefix comparison rather than writing a self-referential
+        # reference file
+        data_root = self.filelib.abs_path(self.path("data"))
+        if path.startswith(f"{data_root}/"):
+            self.log(f"Path is inside the data folder, not linking: {path}")
+            return
+
         # Get the UUID for the dataset
         ds_uuid = ds.index["uuid"]
 
+        # The file in data/ named for the UUID contains the path
+        ref_fp = self.path("data", ds_uuid)
+
+        # If the reference already points to this path, there is no
+        # need to rewrite it -- checking the single file named for the
+        # UUID short-circuits without walking the rest of the home tree
+        try:
+            if self.filelib.read_text(ref_fp) == path:
+                return
+        except (AssertionError, FileNotFoundError):
+            pass
+
         # Write the path to the file named for the UUID
-        self.filelib.write_text(
-            path,
-            self.path("data", ds_uuid)
-        )
+        self.filelib.write_text(path, ref_fp)
 
-    def parse_reference(self, ds_uuid:str) -> Union[None, Dataset]:
+    def parse_reference(self, ds_uuid:str, entry=None, ds_path:str=None) -> Union[None, Dataset]:
         """Check to see if there is a valid reference to this dataset in the data/ folder."""
 
-        # If there is no file with the name `ds_uuid` in ._wb/data/
-        if not self.exists("data", ds_uuid):
-            return
+        # If the referenced path is already known (e.g. from the reference
+        # cache), skip reading the reference file entirely
+        if ds_path is None:
 
-        # If the file is a symlink
-        if self.filelib.islink(self.path("data", ds_uuid)):
-            # Then it is not valid
-            return
+            # If a directory entry was provided, the file is known to exist and
+            # its symlink status is cached on the entry from the directory scan
+            if entry is not None:
+
+                # If the file is a symlink, then it is not valid
+                if entry.is_symlink():
+                    return
 
-        # The file should contain the path to a folder which contains a dataset
-        with open(self.path("data", ds_uuid)) as handle:
-            ds_path = handle.readline()
+                # Reuse the path carried on the entry
+                ref_fp = entry.path
 
-        # If the file does not exist
-        if len(ds_path) == 0 or self.filelib.exists(ds_path) is False:
+            else:
+
+                # Construct the path to the file named `ds_uuid` in data/
+                # a single time, reusing it for each check below
+                ref_fp = self.path("data", ds_uuid)
+
+                # If there is no such file
+                if not self.filelib.exists(ref_fp):
+                    return
+
+                # If the file is a symlink
+                if self.filelib.islink(ref_fp):
+                    # Then it is not valid
+                    return
+
+            # The file should contain the path to a folder which contains a dataset
+            # Read it raw and unbuffered -- the file holds a single short path, so
+            # this skips setting up a buffer and text wrapper for every reference
+            with open(ref_fp, "rb", buffering=0) as handle:
+                ds_path = handle.read().decode().split("\n", 1)[0]
+
+        # If the file is empty, or the referenced folder does not contain an
+        # index, then it is not a valid dataset -- a single isfile check
+        # answers this without constructing a Dataset for the folder
+        if len(ds_path) == 0 or not self.filelib.isfile(f"{ds_path}/._wb/index.json"):
             return
 
-        # If the file does exist
+        # If the folder does contain an index
 
         # Parse the Dataset
         ds = self.dataset(ds_path)
@@ -156,27 +227,207 @@ class Workbench(FolderHierarchyBase):
         else:
             return
             
-    def walk_home_tree(self):
-        """Walk through all of the indexed folders which are linked to the home folder."""
+    def walk_home_tree(self, predicate=None, stop_on_match=False):
+        """
+        Walk through all of the indexed folders which are linked to the home folder.
+        If a `predicate` function is provided, only yield the datasets for which
+        predicate(ds) is True; with `stop_on_match`, end the walk after the
+        first match instead of scanning the remaining references.
+        """
+
+        # Keep track of the dataset folders which have been yielded, so that
+        # two references which resolve to the same folder only produce
+        # a single Dataset
+        seen_paths = set()
+
+        # The mtime of the data/ folder changes whenever a reference file is
+        # added, rewritten, or removed, so it keys a cache of the reference
+        # file contents saved by a previous invocation
+        mtime_ns = os.stat(self.path("data")).st_mtime_ns
+        cached_refs = self._load_reference_cache(mtime_ns)
+
+        # If the cache matches the current state of the data/ folder, skip
+        # reading each of the reference files entirely
+        if cached_refs is not None:
+
+            refs = dict()
+
+            for ds_uuid, ref in cached_refs.items():
 
-        # Iterate over each of the files in data/, which are named for a dataset UUID
-        for ds_uuid in self.listdir("data"):
+                # Newer caches also carry the contents of each dataset's
+                # index file, keyed by its stat signature -- preload them,
+                # so that the walk replaces N index parses with one stat
+                # apiece (read_json re-reads any file modified since)
+                if isinstance(ref, dict):
 
-            # Make a series of checks to see if this file is a valid dataset reference
-            # If it is valid, return a Dataset object
-            ds = self.parse_reference(ds_uuid)
+                    refs[ds_uuid] = ref["path"]
+
+                    if ref.get("index") is not None:
+
+                        index_mtime_ns, index_size, index_dat = ref["index"]
+
+                        self.filelib.preload_json(
+                            f"{ref['path']}/._wb/index.json",
+                            index_mtime_ns,
+                            index_size,
+                            index_dat
+                        )
+
+                # Older caches only mapped the uuid to the path
+                else:
+                    refs[ds_uuid] = ref
+
+            parsed = (
+                (
+                    self.path("data", ds_uuid),
+                    self.parse_reference(ds_uuid, ds_path=ds_path)
+                )
+                for ds_uuid, ds_path in refs.items()
+            )
+
+        else:
+
+            # Get each of the files in data/, which are named for a dataset UUID
+            # Scanning the directory provides the symlink status of each entry
+            # without a separate filesystem call per file
+            entries = self.filelib.scandir(self.path("data"))
+
+            # Parsing each reference is independent I/O (open + read + parse), so
+            # larger trees are parsed concurrently with a thread pool, preserving
+            # order -- small trees, and searches which may stop early, stay serial
+            if len(entries) < 8 or stop_on_match:
+
+                parsed = (
+                    (entry.path, self.parse_reference(entry.name, entry=entry))
+                    for entry in entries
+                )
+
+            else:
+
+                with ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4)
+                ) as pool:
+                    parsed = list(zip(
+                        (entry.path for entry in entries),
+                        pool.map(
+                            lambda entry: self.parse_reference(entry.name, entry=entry),
+                            entries
+                        )
+                    ))
+
+        # Map of UUID -> referenced path for each valid reference, which is
+        # used to save the cache after a full walk
+        valid_refs = dict()
+
+        # Iterate over each reference
+        for ref_fp, ds in parsed:
 
             # If it is not a valid link
             if ds is None:
 
                 # Remove the link
-                self.filelib.rm(self.path("data", ds_uuid))
+                self.filelib.rm(ref_fp)
 
-            # If it is valid
-            else:
+            # If it is valid, and points to a folder which has not been seen
+            elif ds.base_path not in seen_paths:
+
+                seen_paths.add(ds.base_path)
+
+                # Record the valid reference
+                valid_refs[ds.index["uuid"]] = ds
+
+                # If a predicate was provided, skip datasets which do not match
+                if predicate is not None and not predicate(ds):
+                    continue
 
                 yield ds
 
+                # Optionally stop the walk at the first match
+                if stop_on_match:
+                    return
+
+        # After a complete, unfiltered walk, save the cache so that the next
+        # invocation can skip reading each of the reference files
+        if cached_refs is None and predicate is None and not stop_on_match:
+            self._save_reference_cache(valid_refs)
+
+    def _load_reference_cache(self, mtime_ns:int) -> Union[None, dict]:
+        """
+        Return the cached map of dataset UUID -> referenced path, or None if
+        no cache has been saved for the current state of the data/ folder.
+        """
+
+        # Read the cache file saved in the profile folder, if one exists
+        cache = self.filelib.read_json_in_folder(
+            self.base_path,
+            "._wb_dataset_cache.json"
+        )
+
+        # The cache records the mtime of the data/ folder at the time it was
+        # saved -- any change to the set of reference files since then will
+        # have updated that mtime, which rejects the cache
+        if cache is not None and cache.get("mtime_ns") == mtime_ns:
+            return cache["references"]
+
+        return None
+
+    def _save_reference_cache(self, valid_refs:dict) -> None:
+        """Save the map of dataset UUID -> referenced path for later invocations."""
+
+        references = dict()
+
+        # For each valid dataset found by the walk
+        for ds_uuid, ds in valid_refs.items():
+
+            # Also save the contents of the index file along with its stat
+            # signature, so that the next invocation can skip parsing any
+            # index which has not changed since
+            try:
+                st = os.stat(ds.index_fp)
+                index_entry = [st.st_mtime_ns, st.st_size, ds.index]
+
+            except OSError:
+                index_entry = None
+
+            references[ds_uuid] = dict(
+                path=ds.base_path,
+                index=index_entry
+            )
+
+        # Stat the data/ folder after the walk, so that any reference files
+        # which were removed during the walk are reflected in the saved mtime
+        self.filelib.write_json(
+            dict(
+                mtime_ns=os.stat(self.path("data")).st_mtime_ns,
+                references=references
+            ),
+            self.path("._wb_dataset_cache.json")
+        )
+
+    def find_folder_by_uuid(self, uuid:str=None) -> Union[None, str]:
+        """Return the path of the indexed folder with a particular UUID."""
+
+        assert uuid is not None
+
+        # The files in data/ are named for the dataset UUID, so the common
+        # case is a single read of one reference file, with no walk needed
+        ds = self.parse_reference(uuid)
+
+        # If the reference was valid
+        if ds is not None:
+            return ds.base_path
+
+        # Fall back to walking the home tree, which repairs the reference
+        # files as a side effect -- the walk ends as soon as it matches
+        for ds in self.walk_home_tree(
+            predicate=lambda ds: ds.index["uuid"] == uuid,
+            stop_on_match=True
+        ):
+            return ds.base_path
+
+        # No indexed folder has this UUID
+        return None
+
     def dataset(self, path:str) -> Dataset:
         """Generate a Dataset object for a particular path."""
 
@@ -190,41 +441,78 @@ class Workbench(FolderHierarchyBase):
     def link_to_home(self, path:str):
         """Add a symlinnk of a path to the home directory."""
 
+        # Scan the data/ folder a single time, reusing the entries both for
+        # the duplicate-link check and for the collision check below
+        entries = self.filelib.scandir(self.path("data"))
+
         # If there is a link to this folder already in the home directory
-        if path in self.links_from_home_directory():
+        if path in self.links_from_home_directory(entries=entries):
 
             # No need to take any further action
             return
 
         # Get the folder name
-        folder_name = path.rsplit("/", 1)[1]
+        folder_name = self.filelib.basename(path)
 
-        # Get the path to the symlink
-        home_symlink = self.path("data", folder_name)
+        # Get the set of names already present in the data/ folder, so that
+        # collisions can be checked in memory instead of with one
+        # filesystem call per candidate name
+        existing = {entry.name for entry in entries}
+
+        # The name used for the symlink
+        symlink_name = folder_name
 
         # To prevent collisions, add a suffix to make it unique (if not already)
         n = 0
-        while self.filelib.exists(home_symlink):
+        while symlink_name in existing:
 
             # Increment the counter to make a new suffix
             n += 1
 
-            # Make a new the path to the symlink
-            home_symlink = self.path("data", f"{folder_name}_{n}")
+            # Make a new name for the symlink
+            symlink_name = f"{folder_name}_{n}"
+
+        # Get the path to the symlink
+        home_symlink = self.path("data", symlink_name)
 
         # Add a symlink
         self.filelib.symlink(path, home_symlink)
 
-    def links_from_home_directory(self):
-        """Return the list of folders which are linked from the home data directory."""
+    def links_from_home_directory(self, entries:list=None) -> frozenset:
+        """Return the set of folders which are linked from the home data directory."""
 
-        # Make a list of the linked folders
-        return [
-            # Construct the full path to each file
-            self.path("data", fp)
-            # For each of the files in the data/ folder
-            for fp in self.listdir(self.path("data"))
-        ]
+        # If the caller did not provide entries from an existing
+        # directory scan, scan the data/ folder now
+        if entries is None:
+            entries = self.filelib.scandir(self.path("data"))
+
+        # Make a set of the linked folders, which supports O(1) membership checks
+        links = set()
+
+        # Iterate over the files in the data/ folder -- the symlink status of
+        # each entry is cached from the directory scan, with no extra stat calls
+        for entry in entries:
+
+            # If the entry is a symlink
+            if entry.is_symlink():
+
+                # Get the target of the link
+                target = self.filelib.readlink(entry.path)
+
+                # Resolve relative targets against the data/ folder, without
+                # any additional filesystem calls
+                if not target.startswith("/"):
+                    target = os.path.normpath(f"{self.path('data')}/{target}")
+
+                # Add the target of the link
+                links.add(target)
+
+            # Otherwise, add the path of the file itself
+            else:
+
+                links.add(entry.path)
+
+        return frozenset(links)
 
     def list_datasets(self):
         """Return a list of all datasets linked from the home folder."""
@@ -366,6 +654,10 @@ class Workbench(FolderHierarchyBase):
         # Set the attribute
         ds.set_attribute(attribute, value)
 
+        # The dataset was modified in place, so any cached paths, tree,
+        # or lookup indexes held by the collection are now out of date
+        self.datasets.clear_filtered_paths_cache()
+
         # Return the updated configuration
         return ds.index
 
@@ -387,6 +679,10 @@ class Workbench(FolderHierarchyBase):
         # Set the tag
         ds.set_tag(key, value)
 
+        # The dataset was modified in place, so any cached paths, tree,
+        # or lookup indexes held by the collection are now out of date
+        self.datasets.clear_filtered_paths_cache()
+
         # Return the updated configuration
         return ds.index
 
@@ -406,6 +702,10 @@ class Workbench(FolderHierarchyBase):
         # Delete the tag
         ds.delete_tag(key)
 
+        # The dataset was modified in place, so any cached paths, tree,
+        # or lookup indexes held by the collection are now out of date
+        self.datasets.clear_filtered_paths_cache()
+
         # Return the updated configuration
         return ds.index
 
@@ -455,14 +755,8 @@ class Workbench(FolderHierarchyBase):
 
             # Copy the repository asset from the package to the dataset
             self.filelib.copyfile(
-                self.filelib.path_join(
-                    self.helpers_folder,
-                    filename
-                ),
-                self.filelib.path_join(
-                    dest_folder,
-                    filename
-                )
+                f"{self.helpers_folder}/{filename}",
+                f"{dest_folder}/{filename}"
             )
 
     def asset(self, asset_type:str=None, asset_name:str=None) -> Asset:
@@ -747,18 +1041,13 @@ class Workbench(FolderHierarchyBase):
 
         self.log(f"Saving params to {params_folder}")
 
-        # If the folder does not exist
-        if not self.filelib.exists(params_folder):
-
-            # Create it
-            self.log(f"Creating folder {params_folder}")
-            self.filelib.makedirs(params_folder)
+        # Create the folder if it does not already exist -- a single
+        # makedirs call, rather than an exists check followed by makedirs
+        self.filelib.mkdir_p(params_folder)
 
         # Set up the path to use for saving the params
-        params_fp = self.filelib.path_join(
-            params_folder,
-            f"{name}.json"        # Name of the params
-        )
+        # (a direct string join -- the caller validated the name as simple)
+        params_fp = f"{params_folder}/{name}.json"
 
         # If the file already exists
         if self.filelib.exists(params_fp):
@@ -899,18 +1188,19 @@ class Workbench(FolderHierarchyBase):
 
         self.log(f"Listing params from {params_folder}")
 
-        # If the folder does not exist
-        if not self.filelib.exists(params_folder):
+        # Attempt to list the folder directly, rather than first
+        # checking whether it exists
+        try:
+            filenames = self.filelib.listdir(params_folder)
 
-            # Return an empty list
+        # If the folder does not exist, there are no saved params
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        # If the folder does indeed exist
-
         # Return a list of all of the files which end in .json
         return [
             fp[:-len(suffix)]
-            for fp in self.filelib.listdir(params_folder)
+            for fp in filenames
             if fp.endswith(suffix)
         ]
 
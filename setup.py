@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
 import codecs
-from distutils.core import setup
+from setuptools import setup
 import os.path
 from pathlib import Path
 
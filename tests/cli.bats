@@ -109,6 +109,53 @@
 
 }
 
+@test "filtering does not re-read indexes" {
+
+  # After the collection has been populated, chained filters must operate
+  # entirely in memory -- assert that no additional JSON files are parsed
+  # while filters are added, applied, and removed
+  python3 - <<'EOF'
+import os
+from bash_workbench.filelib import FileLib, json_parse_count
+from bash_workbench.logging import setup_logger
+from bash_workbench.workbench import Workbench
+
+filelib = FileLib()
+
+# Point at the same profile used by the CLI tests above
+base_path = filelib.abs_path(
+    filelib.path_join(os.environ["WB_BASE"], os.environ["WB_PROFILE"])
+)
+
+wb = Workbench(
+    base_path=base_path,
+    filelib=filelib,
+    logger=setup_logger(
+        log_stdout=False,
+        log_fp=filelib.path_join(base_path, ".wb_log")
+    ),
+    verbose=False
+)
+
+# Walk the home tree a single time, parsing every index file
+wb.datasets.populate()
+
+# Record the number of JSON files parsed so far
+n_parsed = json_parse_count()
+
+# Chain several filters and render the filtered tree
+wb.datasets.add_filter(field="name", value="Data Folder")
+wb.datasets.add_filter(field="description", value="Very Useful")
+wb.datasets.format_dataset_tree()
+wb.datasets.remove_filter(field="name", value="Data Folder")
+wb.datasets.format_dataset_tree()
+
+# No additional files may have been parsed by any of the steps above
+assert json_parse_count() == n_parsed, "filtering triggered JSON parses"
+EOF
+
+}
+
 @test "update_tags" {
 
   # Add tags to datasets